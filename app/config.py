@@ -57,6 +57,13 @@ class Settings(BaseSettings):
     S3_LOGS_PREFIX: str = Field(default="logs/", env="S3_LOGS_PREFIX")
     S3_REVIEWS_PREFIX: str = Field(default="reviews/", env="S3_REVIEWS_PREFIX")
     S3_ENABLED: bool = Field(default=False, env="S3_ENABLED")
+    # Uploads of at least this many bytes use multipart; smaller ones are a single PUT
+    S3_MULTIPART_THRESHOLD: int = Field(default=8 * 1024 * 1024, env="S3_MULTIPART_THRESHOLD")
+    S3_MAX_POOL_CONNECTIONS: int = Field(default=64, env="S3_MAX_POOL_CONNECTIONS")
+    S3_MAX_CONCURRENCY: int = Field(default=50, env="S3_MAX_CONCURRENCY")
+    # Read review stats fields with S3 Select instead of downloading whole reviews
+    # (S3 Select must be available to the AWS account)
+    S3_SELECT_ENABLED: bool = Field(default=False, env="S3_SELECT_ENABLED")
 
     
     # Static Analysis Configuration
@@ -6,13 +6,94 @@ and PR characteristics.
 """
 
 import logging
+from bisect import bisect_left, bisect_right
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
-from app.llm.schemas import CodeReview, Severity, Category
+from app.llm.schemas import CodeReview, Category, Severity
 
 logger = logging.getLogger(__name__)
 
+# Risk weight per comment severity
+_SEVERITY_WEIGHTS: Dict[Severity, int] = {
+    Severity.CRITICAL: 100,
+    Severity.HIGH: 60,
+    Severity.MEDIUM: 30,
+    Severity.LOW: 15,
+    Severity.INFO: 5,
+}
+
+# Severities that block a merge
+_BLOCKING_SEVERITIES = frozenset({Severity.CRITICAL, Severity.HIGH})
+
+# Component weights for the overall weighted average
+_SEVERITY_WEIGHT = 0.35       # Issues found have highest weight
+_SECURITY_WEIGHT = 0.25       # Security is critical
+_COMPLEXITY_WEIGHT = 0.15     # Code complexity matters
+_SIZE_WEIGHT = 0.15           # PR size affects risk
+_TEST_COVERAGE_WEIGHT = 0.10  # Tests provide safety net
+
+# Risk signal -> score multiplier, applied in order when the signal is truthy
+_RISK_SIGNAL_MULTIPLIERS = (
+    ("is_large_pr", 1.2),
+    ("critical_files", 1.15),
+    ("has_db_migration", 1.25),
+    ("security_sensitive_files", 1.2),
+    ("missing_tests", 1.1),
+)
+
+# Average complexity staircase: a value above THRESHOLDS[i - 1] (and up to
+# THRESHOLDS[i]) maps to SCORES[i]
+_COMPLEXITY_THRESHOLDS = (10, 15, 20)
+_COMPLEXITY_SCORES = (30, 50, 70, 90)
+
+# Substring marking a changed file as a test file (matched case-insensitively)
+_TEST_FILE_MARKER = "test"
+
+# Extensions of changed files that are neither tests nor production code
+_NON_CODE_EXTENSIONS = (".md", ".txt")
+
+# PR size staircases: a value below THRESHOLDS[i] maps to SCORES[i],
+# anything at or above the last threshold maps to SCORES[-1]
+_LINES_CHANGED_THRESHOLDS = (50, 200, 500, 1000)
+_LINES_CHANGED_SCORES = (5, 20, 40, 60, 80)
+_FILES_CHANGED_THRESHOLDS = (3, 10, 25)
+_FILES_CHANGED_SCORES = (5, 20, 40, 60)
+
+
+@dataclass
+class _CommentStats:
+    """
+    Severity aggregates for review comments.
+    
+    Computed in a single pass so the severity, security and blocking-issue
+    calculations read counters instead of each re-scanning the comments.
+    """
+    
+    total: int = 0
+    weighted_severity: float = 0.0  # Sum of severity weight * confidence
+    blocking: int = 0
+    security: int = 0
+    security_blocking: int = 0
+    
+    @classmethod
+    def from_review(cls, review: CodeReview) -> "_CommentStats":
+        stats = cls()
+        weight_of = _SEVERITY_WEIGHTS.get
+        for comment in review.comments:
+            severity = comment.severity
+            is_blocking = severity in _BLOCKING_SEVERITIES
+            
+            stats.total += 1
+            stats.weighted_severity += weight_of(severity, 0) * comment.confidence
+            if is_blocking:
+                stats.blocking += 1
+            if comment.category == Category.SECURITY:
+                stats.security += 1
+                if is_blocking:
+                    stats.security_blocking += 1
+        return stats
+
 
 @dataclass
 class RiskScore:
@@ -62,28 +143,22 @@ def calculate_risk_score(
     Returns:
         Comprehensive RiskScore object
     """
+    comment_stats = _CommentStats.from_review(review)
+    
     # Component scores (each 0-100)
-    severity_score = _calculate_severity_score(review)
+    severity_score = _calculate_severity_score(comment_stats)
     complexity_score = _calculate_complexity_score(static_analysis)
     size_score = _calculate_size_score(diff_info)
-    security_score = _calculate_security_score(review, static_analysis)
+    security_score = _calculate_security_score(comment_stats, static_analysis)
     test_coverage_score = _calculate_test_coverage_score(diff_info, static_analysis)
     
     # Weighted average of components
-    weights = {
-        "severity": 0.35,     # Issues found have highest weight
-        "security": 0.25,     # Security is critical
-        "complexity": 0.15,   # Code complexity matters
-        "size": 0.15,         # PR size affects risk
-        "test_coverage": 0.10,  # Tests provide safety net
-    }
-    
     total_score = (
-        severity_score * weights["severity"] +
-        security_score * weights["security"] +
-        complexity_score * weights["complexity"] +
-        size_score * weights["size"] +
-        test_coverage_score * weights["test_coverage"]
+        severity_score * _SEVERITY_WEIGHT +
+        security_score * _SECURITY_WEIGHT +
+        complexity_score * _COMPLEXITY_WEIGHT +
+        size_score * _SIZE_WEIGHT +
+        test_coverage_score * _TEST_COVERAGE_WEIGHT
     )
     
     # Apply risk signals as multipliers
@@ -100,12 +175,6 @@ def calculate_risk_score(
     else:
         level = "critical"
     
-    # Count issues
-    blocking_issues = len([
-        c for c in review.comments
-        if c.severity in [Severity.CRITICAL, Severity.ERROR]
-    ])
-    
     return RiskScore(
         total=total_score,
         level=level,
@@ -114,41 +183,25 @@ def calculate_risk_score(
         size_score=size_score,
         security_score=security_score,
         test_coverage_score=test_coverage_score,
-        blocking_issues=blocking_issues,
-        total_issues=len(review.comments),
+        blocking_issues=comment_stats.blocking,
+        total_issues=comment_stats.total,
         lines_changed=diff_info.get("total_changes", 0),
         files_changed=len(diff_info.get("files", [])),
     )
 
 
-def _calculate_severity_score(review: CodeReview) -> float:
+def _calculate_severity_score(comment_stats: _CommentStats) -> float:
     """
     Calculate risk score based on issue severity.
     
     Returns score 0-100 where higher means more risk.
     """
-    if not review.comments:
+    if not comment_stats.total:
         return 0.0
     
-    # Weights for each severity level
-    severity_weights = {
-        Severity.CRITICAL: 100,
-        Severity.ERROR: 60,
-        Severity.WARNING: 30,
-        Severity.INFO: 5,
-    }
-    
-    # Calculate weighted sum
-    total_weight = 0
-    for comment in review.comments:
-        weight = severity_weights.get(comment.severity, 0)
-        # Reduce weight by confidence (low confidence issues count less)
-        adjusted_weight = weight * comment.confidence
-        total_weight += adjusted_weight
-    
-    # Normalize by number of comments (cap at 100)
-    # More issues = higher risk, but with diminishing returns
-    score = min(100, total_weight / max(len(review.comments), 1) * 1.5)
+    # Normalize the confidence-adjusted weight sum by number of comments
+    # (cap at 100). More issues = higher risk, but with diminishing returns
+    score = min(100, comment_stats.weighted_severity / comment_stats.total * 1.5)
     
     return score
 
@@ -177,20 +230,12 @@ def _calculate_complexity_score(static_analysis: Optional[Dict[str, Any]]) -> fl
     
     # Map complexity to risk score
     # Complexity > 20 is very high risk
-    if avg_complexity > 20:
-        score = 90
-    elif avg_complexity > 15:
-        score = 70
-    elif avg_complexity > 10:
-        score = 50
-    else:
-        score = 30
+    score = _COMPLEXITY_SCORES[bisect_left(_COMPLEXITY_THRESHOLDS, avg_complexity)]
     
-    # Scale by number of complex functions
+    # Scale by number of complex functions. The factor tops out at 1.0, so
+    # the result never exceeds the largest table score and needs no clamp.
     num_complex = min(len(high_complexity), 10)
-    score = score * (0.5 + 0.05 * num_complex)
-    
-    return min(100, score)
+    return score * (0.5 + 0.05 * num_complex)
 
 
 def _calculate_size_score(diff_info: Dict[str, Any]) -> float:
@@ -202,34 +247,19 @@ def _calculate_size_score(diff_info: Dict[str, Any]) -> float:
     lines_changed = diff_info.get("total_changes", 0)
     files_changed = len(diff_info.get("files", []))
     
-    # Lines changed score
-    if lines_changed < 50:
-        lines_score = 5
-    elif lines_changed < 200:
-        lines_score = 20
-    elif lines_changed < 500:
-        lines_score = 40
-    elif lines_changed < 1000:
-        lines_score = 60
-    else:
-        lines_score = 80
-    
-    # Files changed score
-    if files_changed < 3:
-        files_score = 5
-    elif files_changed < 10:
-        files_score = 20
-    elif files_changed < 25:
-        files_score = 40
-    else:
-        files_score = 60
+    lines_score = _LINES_CHANGED_SCORES[
+        bisect_right(_LINES_CHANGED_THRESHOLDS, lines_changed)
+    ]
+    files_score = _FILES_CHANGED_SCORES[
+        bisect_right(_FILES_CHANGED_THRESHOLDS, files_changed)
+    ]
     
     # Combine (weighted average)
     return lines_score * 0.7 + files_score * 0.3
 
 
 def _calculate_security_score(
-    review: CodeReview,
+    comment_stats: _CommentStats,
     static_analysis: Optional[Dict[str, Any]],
 ) -> float:
     """
@@ -240,14 +270,9 @@ def _calculate_security_score(
     score = 0.0
     
     # Check for security-related review comments
-    security_comments = review.get_comments_by_category(Category.SECURITY)
-    if security_comments:
+    if comment_stats.security:
         # Any security issue is significant
-        critical_security = [
-            c for c in security_comments
-            if c.severity in [Severity.CRITICAL, Severity.ERROR]
-        ]
-        if critical_security:
+        if comment_stats.security_blocking:
             score = 95
         else:
             score = 60
@@ -287,21 +312,22 @@ def _calculate_test_coverage_score(
     """
     files = diff_info.get("files", [])
     
-    # Check if PR includes test files
-    has_tests = any("test" in f.lower() for f in files)
+    # Classify each file once: test, production code, or neither
+    has_tests = False
+    has_non_tests = False
+    has_production_code = False
+    for f in files:
+        if _TEST_FILE_MARKER in f.lower():
+            has_tests = True
+        else:
+            has_non_tests = True
+            if not f.endswith(_NON_CODE_EXTENSIONS):
+                has_production_code = True
     
     # Check if PR modifies only test files
-    only_tests = all("test" in f.lower() for f in files) if files else False
-    
-    if only_tests:
+    if has_tests and not has_non_tests:
         return 0  # Test-only changes are low risk
     
-    # Check for production code without tests
-    has_production_code = any(
-        not ("test" in f.lower() or f.endswith(".md") or f.endswith(".txt"))
-        for f in files
-    )
-    
     if has_production_code and not has_tests:
         return 70  # Production code without tests is risky
     
@@ -333,25 +359,9 @@ def _apply_risk_signal_modifiers(
     """
     score = base_score
     
-    # Large PR modifier
-    if risk_signals.get("is_large_pr"):
-        score *= 1.2
-    
-    # Critical files modifier
-    if risk_signals.get("critical_files"):
-        score *= 1.15
-    
-    # Database migration modifier
-    if risk_signals.get("has_db_migration"):
-        score *= 1.25
-    
-    # Security-sensitive files modifier
-    if risk_signals.get("security_sensitive_files"):
-        score *= 1.2
-    
-    # Missing tests modifier
-    if risk_signals.get("missing_tests"):
-        score *= 1.1
+    for signal, multiplier in _RISK_SIGNAL_MULTIPLIERS:
+        if risk_signals.get(signal):
+            score *= multiplier
     
     # Cap at 100
     return min(100, score)
@@ -384,6 +394,23 @@ class RiskScorer:
             risk_signals=review_result.get("risk_signals"),
         )
     
+    def batch_calculate(
+        self,
+        review_results: List[Dict[str, Any]],
+    ) -> List[RiskScore]:
+        """
+        Calculate risk scores for many review results, e.g. when backfilling
+        historical PRs after a weight change.
+        
+        Args:
+            review_results: Review results as accepted by calculate()
+        
+        Returns:
+            RiskScore objects in the same order as review_results
+        """
+        calculate = self.calculate
+        return [calculate(result) for result in review_results]
+    
     def explain_score(self, risk_score: RiskScore) -> str:
         """
         Generate human-readable explanation of risk score.
@@ -0,0 +1,51 @@
+"""
+Result caching and temp-file naming shared by the static analyzers.
+"""
+
+import hashlib
+from typing import Any, Dict, Optional
+
+# Upper bound on cached per-file results per analyzer (oldest entries are evicted)
+RESULT_CACHE_MAX_ENTRIES = 2048
+
+
+class ResultCache:
+    """
+    Bounded per-file analyzer results, keyed by (filename, content hash).
+    
+    Lets unchanged files skip re-analysis when a PR is reviewed again. Once
+    full, the oldest entry is evicted to make room.
+    """
+    
+    def __init__(self, max_entries: int = RESULT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: Dict[tuple, Any] = {}
+    
+    @staticmethod
+    def key(filename: str, data: bytes) -> tuple:
+        """Build the cache key for a file's UTF-8 encoded content."""
+        return (filename, hashlib.blake2b(data, digest_size=16).digest())
+    
+    def get(self, key: tuple) -> Optional[Any]:
+        """Return the cached result for key, or None."""
+        return self._entries.get(key)
+    
+    def put(self, key: tuple, value: Any):
+        """Cache a result, evicting the oldest entry when full."""
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = value
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def temp_name(filename: str) -> str:
+    """
+    Return the name a file is written under in an analyzer's temp directory.
+    
+    The basename is prefixed with a hash of the full path so files sharing a
+    basename in different directories don't overwrite each other.
+    """
+    path_hash = hashlib.blake2b(filename.encode('utf-8'), digest_size=6).hexdigest()
+    return f"{path_hash}_{filename.rpartition('/')[2]}"
@@ -0,0 +1,47 @@
+"""
+Subprocess helper shared by the static analyzers.
+"""
+
+import asyncio
+from typing import List, Optional
+
+
+async def run_subprocess(
+    cmd: List[str],
+    timeout: float,
+    stdin: Optional[bytes] = None,
+) -> bytes:
+    """
+    Run an analysis tool without blocking the event loop.
+    
+    Args:
+        cmd: Command and arguments
+        timeout: Timeout in seconds
+        stdin: Optional input to feed the process
+    
+    Returns:
+        bytes: Raw stdout, left undecoded so JSON output can be parsed
+            from bytes directly
+    
+    Raises:
+        asyncio.TimeoutError: If the command does not finish in time
+            (the process is killed first)
+        FileNotFoundError: If the tool is not installed
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE if stdin is not None else asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(stdin), timeout=timeout)
+    except BaseException:
+        # Timed out or the caller was cancelled: don't leave the tool running
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    
+    return stdout
@@ -7,18 +7,26 @@ Analyzes code complexity metrics:
 - Code metrics for each function/method
 """
 
-import subprocess
-import json
+import asyncio
 import logging
 import tempfile
 import os
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
+import orjson
+
 from app.config import settings
+from app.static_analysis._helpers import ResultCache, temp_name
+from app.static_analysis._subprocess import run_subprocess
 
 logger = logging.getLogger(__name__)
 
+# Radon results, (functions, maintainability index), per (filename, content
+# hash). Module-level because a ComplexityAnalyzer is built per review, so a
+# per-instance cache would never see the re-review it exists for.
+_result_cache = ResultCache()
+
 
 @dataclass
 class FunctionComplexity:
@@ -105,17 +113,26 @@ class ComplexityAnalyzer:
             files: List of Python file metadata
             file_contents: File contents mapping
         """
-        # Create temporary directory for files
+        # Create temporary directory for files. Temp paths are built from its
+        # absolute form so they match radon's output keys as-is.
         with tempfile.TemporaryDirectory() as tmpdir:
-            # Write files to temp directory
+            tmpdir = os.path.abspath(tmpdir)
+            # Write files to temp directory, skipping ones already analyzed
             temp_files = []
+            cache_keys = {}
             for file_meta in files:
                 filename = file_meta['filename']
                 if filename not in file_contents:
                     continue
                 
-                # Create file path
-                temp_path = os.path.join(tmpdir, os.path.basename(filename))
+                cache_key = ResultCache.key(filename, file_contents[filename].encode('utf-8'))
+                cached = _result_cache.get(cache_key)
+                if cached is not None:
+                    self._record_result(filename, file_contents[filename], *cached)
+                    continue
+                cache_keys[filename] = cache_key
+                
+                temp_path = f"{tmpdir}/{temp_name(filename)}"
                 
                 with open(temp_path, 'w') as f:
                     f.write(file_contents[filename])
@@ -131,37 +148,64 @@ class ComplexityAnalyzer:
             # Run radon mi (maintainability index)
             mi_results = await self._run_radon_mi(temp_files)
             
+            # Only cache when both radon runs succeeded, so a failed or
+            # timed-out run doesn't pin partial results for these files
+            cacheable = cc_results is not None and mi_results is not None
+            cc_results = cc_results or {}
+            mi_results = mi_results or {}
+            
             # Combine results
             for temp_path, original_filename in temp_files:
                 functions = cc_results.get(temp_path, [])
                 maintainability = mi_results.get(temp_path)
                 
                 if functions or maintainability is not None:
-                    avg_complexity = (
-                        sum(f.cyclomatic_complexity for f in functions) / len(functions)
-                        if functions else 0.0
+                    if cacheable:
+                        _result_cache.put(
+                            cache_keys[original_filename], (functions, maintainability)
+                        )
+                    self._record_result(
+                        original_filename,
+                        file_contents[original_filename],
+                        functions,
+                        maintainability,
                     )
-                    
-                    self.results.append(FileComplexity(
-                        file=original_filename,
-                        average_complexity=round(avg_complexity, 2),
-                        total_lines=len(file_contents[original_filename].split('\n')),
-                        functions=functions,
-                        maintainability_index=maintainability,
-                    ))
+    
+    def _record_result(
+        self,
+        filename: str,
+        content: str,
+        functions: List[FunctionComplexity],
+        maintainability: Optional[float],
+    ):
+        """Append a FileComplexity built from radon results to self.results."""
+        avg_complexity = (
+            sum(f.cyclomatic_complexity for f in functions) / len(functions)
+            if functions else 0.0
+        )
+        
+        self.results.append(FileComplexity(
+            file=filename,
+            average_complexity=round(avg_complexity, 2),
+            total_lines=len(content.split('\n')),
+            functions=functions,
+            maintainability_index=maintainability,
+        ))
     
     async def _run_radon_cc(
         self,
         temp_files: List[tuple],
-    ) -> Dict[str, List[FunctionComplexity]]:
+    ) -> Optional[Dict[str, List[FunctionComplexity]]]:
         """
         Run radon cyclomatic complexity analysis.
         
         Args:
-            temp_files: List of (temp_path, original_filename) tuples
+            temp_files: List of (absolute temp_path, original_filename) tuples
         
         Returns:
-            Dict[str, List[FunctionComplexity]]: Results by temp path
+            Optional[Dict[str, List[FunctionComplexity]]]: Results by temp
+                path, or None if radon could not run or its output could not
+                be parsed
         """
         results = {}
         
@@ -173,24 +217,19 @@ class ComplexityAnalyzer:
                 '--min', 'A',  # Show all complexity levels
             ] + [path for path, _ in temp_files]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            # Keep stdout as bytes; orjson parses it without an
+            # intermediate decoded copy of the whole payload
+            stdout = await run_subprocess(cmd, timeout=30)
             
-            if result.stdout:
+            if stdout:
                 try:
-                    radon_data = json.loads(result.stdout)
+                    radon_data = orjson.loads(stdout)
                     
                     for temp_path, _ in temp_files:
-                        abs_path = os.path.abspath(temp_path)
-                        
-                        if abs_path in radon_data:
+                        if temp_path in radon_data:
                             functions = []
                             
-                            for func_data in radon_data[abs_path]:
+                            for func_data in radon_data[temp_path]:
                                 functions.append(FunctionComplexity(
                                     name=func_data['name'],
                                     line_number=func_data['lineno'],
@@ -200,30 +239,36 @@ class ComplexityAnalyzer:
                             
                             results[temp_path] = functions
                 
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.error("Failed to parse radon cc JSON output")
+                    return None
         
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.warning("Radon cc timed out")
+            return None
         except FileNotFoundError:
             logger.warning("Radon not installed")
+            return None
         except Exception as e:
             logger.error(f"Radon cc error: {e}")
+            return None
         
         return results
     
     async def _run_radon_mi(
         self,
         temp_files: List[tuple],
-    ) -> Dict[str, float]:
+    ) -> Optional[Dict[str, float]]:
         """
         Run radon maintainability index analysis.
         
         Args:
-            temp_files: List of (temp_path, original_filename) tuples
+            temp_files: List of (absolute temp_path, original_filename) tuples
         
         Returns:
-            Dict[str, float]: Maintainability index by temp path
+            Optional[Dict[str, float]]: Maintainability index by temp path,
+                or None if radon could not run or its output could not be
+                parsed
         """
         results = {}
         
@@ -234,22 +279,17 @@ class ComplexityAnalyzer:
                 '--json',
             ] + [path for path, _ in temp_files]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            # Keep stdout as bytes; orjson parses it without an
+            # intermediate decoded copy of the whole payload
+            stdout = await run_subprocess(cmd, timeout=30)
             
-            if result.stdout:
+            if stdout:
                 try:
-                    radon_data = json.loads(result.stdout)
+                    radon_data = orjson.loads(stdout)
                     
                     for temp_path, _ in temp_files:
-                        abs_path = os.path.abspath(temp_path)
-                        
-                        if abs_path in radon_data:
-                            mi_data = radon_data[abs_path]
+                        if temp_path in radon_data:
+                            mi_data = radon_data[temp_path]
                             
                             # MI can be a dict or a number
                             if isinstance(mi_data, dict):
@@ -259,15 +299,19 @@ class ComplexityAnalyzer:
                             
                             results[temp_path] = round(mi, 2)
                 
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.error("Failed to parse radon mi JSON output")
+                    return None
         
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             logger.warning("Radon mi timed out")
+            return None
         except FileNotFoundError:
             logger.warning("Radon not installed")
+            return None
         except Exception as e:
             logger.error(f"Radon mi error: {e}")
+            return None
         
         return results
     
@@ -328,26 +372,25 @@ class ComplexityAnalyzer:
         complex_funcs = self.get_complex_functions()
         low_mi_files = self.get_low_maintainability_files()
         
-        # Calculate overall statistics
-        all_functions = []
+        # Calculate overall statistics in a single pass over the results
+        total_complexity = 0
+        total_functions = 0
+        mi_sum = 0.0
+        mi_count = 0
         for result in self.results:
-            all_functions.extend(result.functions)
+            for func in result.functions:
+                total_complexity += func.cyclomatic_complexity
+            total_functions += len(result.functions)
+            if result.maintainability_index is not None:
+                mi_sum += result.maintainability_index
+                mi_count += 1
         
-        avg_complexity = (
-            sum(f.cyclomatic_complexity for f in all_functions) / len(all_functions)
-            if all_functions else 0.0
-        )
-        
-        mi_values = [
-            r.maintainability_index 
-            for r in self.results 
-            if r.maintainability_index is not None
-        ]
-        avg_mi = sum(mi_values) / len(mi_values) if mi_values else None
+        avg_complexity = total_complexity / total_functions if total_functions else 0.0
+        avg_mi = mi_sum / mi_count if mi_count else None
         
         return {
             "files_analyzed": len(self.results),
-            "total_functions": len(all_functions),
+            "total_functions": total_functions,
             "average_complexity": round(avg_complexity, 2),
             "complex_functions_count": len(complex_funcs),
             "average_maintainability_index": round(avg_mi, 2) if avg_mi else None,
@@ -8,16 +8,36 @@ Can parse coverage reports from various formats:
 - JaCoCo (Java)
 """
 
-import json
-import xml.etree.ElementTree as ET
+import io
 import logging
-from typing import Dict, Any, Optional, List
+import posixpath
+from bisect import bisect_left
+from typing import Dict, Any, Optional, List, FrozenSet
 from dataclasses import dataclass
 
+import orjson
+
+try:
+    # libxml2-backed parser is much faster on large reports; the stdlib
+    # parser exposes the same iterparse/ParseError API used below
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _normalize_path(path: str) -> str:
+    """
+    Normalize a file path for matching coverage entries to PR filenames.
+    
+    Coverage tools may emit "./"-prefixed, redundant or Windows-style
+    paths, while PR file lists use clean repo-relative POSIX paths.
+    """
+    return posixpath.normpath(path.replace('\\', '/'))
+
+
+@dataclass(slots=True, frozen=True)
 class FileCoverage:
     """Coverage data for a single file."""
     file: str
@@ -27,10 +47,10 @@ class FileCoverage:
     lines_total: int = 0
     branches_covered: int = 0
     branches_total: int = 0
-    uncovered_lines: List[int] = None
+    uncovered_lines: FrozenSet[int] = frozenset()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoverageSummary:
     """Overall coverage summary."""
     line_coverage: float
@@ -58,6 +78,12 @@ class CoverageAnalyzer:
         """Initialize coverage analyzer."""
         self.file_coverage: Dict[str, FileCoverage] = {}
         self.summary: Optional[CoverageSummary] = None
+        # Files sorted by line coverage, plus their coverage values for
+        # bisecting; built lazily, reset whenever a report is parsed
+        self._by_coverage: Optional[List[FileCoverage]] = None
+        self._coverage_keys: Optional[List[float]] = None
+        # Normalized path -> coverage; built lazily, reset whenever a report is parsed
+        self._normalized_index: Optional[Dict[str, FileCoverage]] = None
     
     def parse_coverage_report(
         self,
@@ -92,21 +118,27 @@ class CoverageAnalyzer:
         Returns:
             CoverageSummary: Parsed summary
         """
+        self._by_coverage = self._coverage_keys = None
+        self._normalized_index = None
+        
         try:
-            data = json.loads(report_data)
+            data = orjson.loads(report_data)
             
-            files = data.get('files', {})
+            files = data.pop('files', {})
             totals = data.get('totals', {})
             
-            # Parse file-level coverage
-            for filepath, file_data in files.items():
+            # Parse file-level coverage. Each raw entry is popped as it is
+            # converted so the decoded report is released incrementally
+            # instead of being held alongside every FileCoverage.
+            for filepath in list(files):
+                file_data = files.pop(filepath)
                 summary = file_data.get('summary', {})
                 
                 line_coverage = (
                     summary.get('percent_covered', 0.0)
                 )
                 
-                missing_lines = file_data.get('missing_lines', [])
+                missing_lines = frozenset(file_data.get('missing_lines', ()))
                 
                 self.file_coverage[filepath] = FileCoverage(
                     file=filepath,
@@ -141,7 +173,7 @@ class CoverageAnalyzer:
             
             return self.summary
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON coverage: {e}")
             return None
         except Exception as e:
@@ -158,42 +190,72 @@ class CoverageAnalyzer:
         Returns:
             CoverageSummary: Parsed summary
         """
+        self._by_coverage = self._coverage_keys = None
+        self._normalized_index = None
+        
         try:
-            root = ET.fromstring(report_data)
+            # Stream the report rather than building the whole tree: line
+            # counts are accumulated per class and each class element is
+            # cleared once its FileCoverage has been recorded.
+            path = []  # Tags of the currently open elements
+            in_class_lines = False  # Inside a class's own <lines> element
+            has_lines = False
+            lines_total = 0
+            lines_covered = 0
+            uncovered = []
             
-            # Parse packages/classes
-            for package in root.findall('.//package'):
-                for class_elem in package.findall('classes/class'):
-                    filename = class_elem.get('filename')
-                    
-                    lines_elem = class_elem.find('lines')
-                    if lines_elem is not None:
-                        lines = lines_elem.findall('line')
-                        
-                        lines_total = len(lines)
-                        lines_covered = sum(
-                            1 for line in lines 
-                            if int(line.get('hits', 0)) > 0
-                        )
+            source = io.BytesIO(
+                report_data if isinstance(report_data, bytes) else report_data.encode('utf-8')
+            )
+            
+            for event, elem in ET.iterparse(source, events=('start', 'end')):
+                if event == 'start':
+                    tag = elem.tag
+                    path.append(tag)
+                    if tag == 'class' and path[-3:-1] == ['package', 'classes']:
+                        has_lines = False
+                        lines_total = 0
+                        lines_covered = 0
+                        uncovered = []
+                    elif tag == 'lines' and path[-2:-1] == ['class']:
+                        in_class_lines = True
+                    continue
+                
+                # The per-line branch runs for every line in the report, so
+                # it only tests the tag and a flag rather than slicing path
+                tag = path.pop()
+                
+                if tag == 'line':
+                    if in_class_lines:
+                        lines_total += 1
+                        # Hit counts are non-negative integers, so comparing
+                        # the raw attribute skips an int() conversion per line
+                        if elem.get('hits', '0') != '0':
+                            lines_covered += 1
+                        else:
+                            uncovered.append(int(elem.get('number')))
+                
+                elif tag == 'lines' and in_class_lines:
+                    in_class_lines = False
+                    has_lines = True
+                
+                elif tag == 'class' and path[-2:] == ['package', 'classes']:
+                    if has_lines:
+                        filename = elem.get('filename')
                         
                         line_coverage = (
                             (lines_covered / lines_total * 100) 
                             if lines_total > 0 else 0.0
                         )
                         
-                        uncovered = [
-                            int(line.get('number'))
-                            for line in lines
-                            if int(line.get('hits', 0)) == 0
-                        ]
-                        
                         self.file_coverage[filename] = FileCoverage(
                             file=filename,
                             line_coverage=line_coverage,
                             lines_covered=lines_covered,
                             lines_total=lines_total,
-                            uncovered_lines=uncovered,
+                            uncovered_lines=frozenset(uncovered),
                         )
+                    elem.clear()
             
             # Calculate overall summary
             total_lines = sum(f.lines_total for f in self.file_coverage.values())
@@ -247,13 +309,34 @@ class CoverageAnalyzer:
         Returns:
             Dict[str, FileCoverage]: Coverage by file
         """
-        result = {}
+        # One hashed lookup per filename, keeping the caller's order
+        lookup = self._lookup
+        return {
+            filename: coverage
+            for filename in filenames
+            if (coverage := lookup(filename)) is not None
+        }
+    
+    def _lookup(self, filename: str) -> Optional[FileCoverage]:
+        """
+        Find coverage for a file, tolerating path spelling differences.
+        
+        Args:
+            filename: File path as used by the caller
+        
+        Returns:
+            Optional[FileCoverage]: Coverage data, if the report has the file
+        """
+        coverage = self.file_coverage.get(filename)
+        if coverage is not None:
+            return coverage
         
-        for filename in filenames:
-            if filename in self.file_coverage:
-                result[filename] = self.file_coverage[filename]
+        if self._normalized_index is None:
+            self._normalized_index = {
+                _normalize_path(path): cov for path, cov in self.file_coverage.items()
+            }
         
-        return result
+        return self._normalized_index.get(_normalize_path(filename))
     
     def get_low_coverage_files(
         self,
@@ -266,12 +349,16 @@ class CoverageAnalyzer:
             threshold: Coverage percentage threshold
         
         Returns:
-            List[FileCoverage]: Low coverage files
+            List[FileCoverage]: Low coverage files, lowest coverage first
         """
-        return [
-            coverage for coverage in self.file_coverage.values()
-            if coverage.line_coverage < threshold
-        ]
+        if self._by_coverage is None:
+            self._by_coverage = sorted(
+                self.file_coverage.values(),
+                key=lambda coverage: coverage.line_coverage,
+            )
+            self._coverage_keys = [coverage.line_coverage for coverage in self._by_coverage]
+        
+        return self._by_coverage[:bisect_left(self._coverage_keys, threshold)]
     
     def get_uncovered_lines_in_diff(
         self,
@@ -290,18 +377,17 @@ class CoverageAnalyzer:
         Returns:
             List[int]: Changed lines that are uncovered
         """
-        if filename not in self.file_coverage:
-            return []
-        
-        file_cov = self.file_coverage[filename]
+        file_cov = self._lookup(filename)
         
-        if not file_cov.uncovered_lines:
+        if file_cov is None or not file_cov.uncovered_lines:
             return []
         
-        # Intersection of changed lines and uncovered lines
+        # Intersection of changed lines and uncovered lines (hashed lookups,
+        # preserving the order of changed_lines)
+        uncovered_lines = file_cov.uncovered_lines
         uncovered_in_diff = [
             line for line in changed_lines
-            if line in file_cov.uncovered_lines
+            if line in uncovered_lines
         ]
         
         return uncovered_in_diff
@@ -327,29 +413,26 @@ class CoverageAnalyzer:
                 "message": "No coverage data available for changed files",
             }
         
-        # Calculate average coverage of changed files
-        avg_coverage = sum(
-            f.line_coverage for f in changed_coverage.values()
-        ) / len(changed_coverage)
+        # Sum coverage for the average and collect low coverage files in
+        # a single pass over the changed files
+        total_coverage = 0.0
+        low_coverage_details = []
+        for f in changed_coverage.values():
+            total_coverage += f.line_coverage
+            if f.line_coverage < 80.0:
+                low_coverage_details.append({
+                    "file": f.file,
+                    "coverage": f.line_coverage,
+                })
         
-        # Count low coverage files
-        low_coverage = [
-            f for f in changed_coverage.values()
-            if f.line_coverage < 80.0
-        ]
+        avg_coverage = total_coverage / len(changed_coverage)
         
         return {
             "has_coverage_data": True,
             "files_with_coverage": len(changed_coverage),
             "average_coverage": round(avg_coverage, 2),
-            "low_coverage_files": len(low_coverage),
-            "low_coverage_details": [
-                {
-                    "file": f.file,
-                    "coverage": f.line_coverage,
-                }
-                for f in low_coverage
-            ],
+            "low_coverage_files": len(low_coverage_details),
+            "low_coverage_details": low_coverage_details,
         }
     
     def get_summary_dict(self) -> Optional[Dict[str, Any]]:
@@ -7,21 +7,35 @@ Integrates with linting tools to detect style and correctness issues:
 - ESLint for JavaScript/TypeScript (optional)
 """
 
-import subprocess
-import json
+import ast
+import asyncio
 import logging
 import tempfile
 import os
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+import orjson
+
 from app.config import settings
+from app.static_analysis._helpers import ResultCache, temp_name
+from app.static_analysis._subprocess import run_subprocess
 
 logger = logging.getLogger(__name__)
 
+# Parent directory for pylint's temp files: RAM-backed /dev/shm when it is
+# usable, otherwise the platform default
+_TEMP_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+# Lint issues per (filename, content hash). Module-level because a
+# LintingAnalyzer is built per review, so a per-instance cache would never see
+# the re-review it exists for.
+_lint_cache = ResultCache()
+
 
-class LintSeverity(Enum):
+class LintSeverity(str, Enum):
     """Lint issue severity levels."""
     ERROR = "error"
     WARNING = "warning"
@@ -29,7 +43,24 @@ class LintSeverity(Enum):
     STYLE = "style"
 
 
-@dataclass
+# flake8 code prefix -> severity (E: pycodestyle error, W: warning, F: pyflakes)
+_FLAKE8_SEVERITY_BY_PREFIX = {
+    'E': LintSeverity.ERROR,
+    'W': LintSeverity.WARNING,
+    'F': LintSeverity.ERROR,
+}
+
+# pylint message type -> severity
+_PYLINT_SEVERITY_BY_TYPE = {
+    'error': LintSeverity.ERROR,
+    'warning': LintSeverity.WARNING,
+    'refactor': LintSeverity.INFO,
+    'convention': LintSeverity.STYLE,
+    'info': LintSeverity.INFO,
+}
+
+
+@dataclass(slots=True)
 class LintIssue:
     """Represents a single linting issue."""
     file: str
@@ -51,6 +82,8 @@ class LintingAnalyzer:
     def __init__(self):
         """Initialize linting analyzer."""
         self.issues: List[LintIssue] = []
+        # Cached _count_by_severity() result; reset whenever issues change
+        self._severity_counts: Optional[Dict[str, int]] = None
     
     async def analyze(
         self,
@@ -72,6 +105,7 @@ class LintingAnalyzer:
             return []
         
         self.issues = []
+        self._severity_counts = None
         
         # Group files by language
         python_files = [
@@ -111,183 +145,241 @@ class LintingAnalyzer:
         """
         Run Python linting tools (flake8, pylint).
         
-        Args:
-            files: List of Python file metadata
-            file_contents: File contents mapping
-        """
-        # Run flake8
-        flake8_issues = await self._run_flake8(files, file_contents)
-        self.issues.extend(flake8_issues)
-        
-        # Run pylint
-        pylint_issues = await self._run_pylint(files, file_contents)
-        self.issues.extend(pylint_issues)
-    
-    async def _run_flake8(
-        self,
-        files: List[Dict[str, Any]],
-        file_contents: Dict[str, str],
-    ) -> List[LintIssue]:
-        """
-        Run flake8 on Python files.
+        Files are written once to a temporary directory for pylint (in
+        memory-backed /dev/shm where available); flake8's checks run
+        in-process on the file contents. Files whose content was
+        already linted are served from the lint cache and not re-run.
         
         Args:
             files: List of Python file metadata
             file_contents: File contents mapping
-        
-        Returns:
-            List[LintIssue]: Flake8 issues
         """
-        issues = []
+        cache_keys = {}
+        flake8_issues = pylint_issues = None
         
-        # Create temporary directory for files
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Write files to temp directory
+        with tempfile.TemporaryDirectory(dir=_TEMP_ROOT) as tmpdir:
+            # Write files to temp directory, skipping ones already linted
             temp_files = []
             for file_meta in files:
                 filename = file_meta['filename']
                 if filename not in file_contents:
                     continue
                 
-                # Create file path
-                temp_path = os.path.join(tmpdir, os.path.basename(filename))
+                content = file_contents[filename]
+                cache_key = ResultCache.key(filename, content.encode('utf-8'))
+                cached = _lint_cache.get(cache_key)
+                if cached is not None:
+                    self.issues.extend(cached)
+                    continue
+                cache_keys[filename] = cache_key
+                
+                temp_path = os.path.join(tmpdir, temp_name(filename))
                 
                 with open(temp_path, 'w') as f:
-                    f.write(file_contents[filename])
+                    f.write(content)
                 
                 temp_files.append((temp_path, filename))
             
-            if not temp_files:
-                return issues
+            if temp_files:
+                # Run flake8 and pylint concurrently
+                flake8_issues, pylint_issues = await asyncio.gather(
+                    self._run_flake8([
+                        (filename, file_contents[filename]) for _, filename in temp_files
+                    ]),
+                    self._run_pylint(temp_files),
+                )
+        
+        new_issues = (flake8_issues or []) + (pylint_issues or [])
+        self.issues.extend(new_issues)
+        
+        # Only cache when both tools ran, so a missing or timed-out linter
+        # doesn't pin empty results for these files
+        if flake8_issues is not None and pylint_issues is not None:
+            issues_by_file = {filename: [] for filename in cache_keys}
+            for issue in new_issues:
+                if issue.file in issues_by_file:
+                    issues_by_file[issue.file].append(issue)
+            for filename, file_issues in issues_by_file.items():
+                _lint_cache.put(cache_keys[filename], file_issues)
+        
+        self._severity_counts = None
+    
+    async def _run_flake8(
+        self,
+        sources: List[tuple],
+    ) -> Optional[List[LintIssue]]:
+        """
+        Run flake8's checks (pyflakes + pycodestyle) on Python sources.
+        
+        The checker libraries are called in-process on a worker thread
+        rather than through the flake8 CLI, avoiding interpreter startup,
+        plugin discovery and JSON round-tripping per run.
+        
+        Args:
+            sources: List of (original_filename, content) tuples
+        
+        Returns:
+            Optional[List[LintIssue]]: Flake8 issues, or None if the checks
+                could not run
+        """
+        try:
+            import pycodestyle
+            from pyflakes import checker as pyflakes_checker
+            from flake8.plugins.pyflakes import FLAKE8_PYFLAKES_CODES
+            from flake8.violation import Violation
+        except ImportError:
+            logger.warning("Flake8 not installed")
+            return None
+        
+        style = pycodestyle.StyleGuide(
+            max_line_length=settings.FLAKE8_MAX_LINE_LENGTH,
+            ignore=pycodestyle.DEFAULT_IGNORE.split(',') + ['E203', 'W503'],  # Common ignores
+            quiet=True,
+        )
+        
+        class _CollectingReport(pycodestyle.BaseReport):
+            """pycodestyle report that keeps (line, column, code, text) tuples."""
+            
+            def init_file(self, filename, lines, expected, line_offset):
+                self.found = []
+                return super().init_file(filename, lines, expected, line_offset)
+            
+            def error(self, line_number, offset, text, check):
+                code = super().error(line_number, offset, text, check)
+                if code:
+                    self.found.append((line_number, offset + 1, code, text[5:]))
+                return code
+        
+        class _Checker(pycodestyle.Checker):
+            """pycodestyle checker that leaves '# noqa' handling to is_noqa()."""
+            
+            # Like flake8, run every check with noqa=False. Otherwise
+            # pycodestyle skips E501, E711, E712, E721, E722 and W605 on any
+            # line with a '# noqa' comment, whatever codes the comment names.
+            noqa = property(lambda self: False, lambda self, value: None)
+        
+        def check_source(filename: str, content: str) -> List[LintIssue]:
+            lines = content.splitlines(True)
+            
+            def is_noqa(line: int, column: int, code: str, text: str) -> bool:
+                # Honour '# noqa' and '# noqa: <codes>' comments exactly as
+                # the flake8 CLI does
+                physical_line = lines[line - 1] if 0 < line <= len(lines) else ''
+                if 'noqa' not in physical_line.lower():
+                    return False
+                return Violation(
+                    code, filename, line, column, text, physical_line
+                ).is_inline_ignored(False)
             
-            # Run flake8
             try:
-                cmd = [
-                    'flake8',
-                    '--format=json',
-                    f'--max-line-length={settings.FLAKE8_MAX_LINE_LENGTH}',
-                    '--extend-ignore=E203,W503',  # Common ignores
-                ] + [path for path, _ in temp_files]
+                tree = ast.parse(content, filename=filename)
+            except SyntaxError as e:
+                # Like flake8, report only the syntax error for unparsable files
+                findings = [(e.lineno or 1, e.offset or 1, 'E999', f"SyntaxError: {e.msg}")]
+            else:
+                findings = [
+                    (
+                        message.lineno,
+                        getattr(message, 'col', 0) + 1,
+                        FLAKE8_PYFLAKES_CODES.get(type(message).__name__, 'F999'),
+                        message.message % message.message_args,
+                    )
+                    for message in pyflakes_checker.Checker(tree, filename=filename).messages
+                ]
                 
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
+                report = _CollectingReport(style.options)
+                _Checker(
+                    filename=filename,
+                    lines=lines,
+                    options=style.options,
+                    report=report,
+                ).check_all()
+                findings.extend(report.found)
+            
+            return [
+                LintIssue(
+                    file=filename,
+                    line=line,
+                    column=column,
+                    severity=self._map_flake8_severity(code),
+                    code=code,
+                    message=text,
+                    tool='flake8',
                 )
-                
-                # Parse flake8 output
-                if result.stdout:
-                    try:
-                        flake8_data = json.loads(result.stdout)
-                        
-                        for temp_path, original_filename in temp_files:
-                            if temp_path in flake8_data:
-                                for issue_data in flake8_data[temp_path]:
-                                    issues.append(LintIssue(
-                                        file=original_filename,
-                                        line=issue_data['line_number'],
-                                        column=issue_data['column_number'],
-                                        severity=self._map_flake8_severity(issue_data['code']),
-                                        code=issue_data['code'],
-                                        message=issue_data['text'],
-                                        tool='flake8',
-                                    ))
-                    except json.JSONDecodeError:
-                        # Fallback: parse text output
-                        pass
-                
-            except subprocess.TimeoutExpired:
-                logger.warning("Flake8 timed out")
-            except FileNotFoundError:
-                logger.warning("Flake8 not installed")
-            except Exception as e:
-                logger.error(f"Flake8 error: {e}")
-        
-        return issues
+                for line, column, code, text in sorted(findings)
+                if not is_noqa(line, column, code, text)
+            ]
+        
+        def check_all() -> List[LintIssue]:
+            issues = []
+            for filename, content in sources:
+                issues.extend(check_source(filename, content))
+            return issues
+        
+        try:
+            return await asyncio.to_thread(check_all)
+        except Exception as e:
+            logger.error(f"Flake8 error: {e}")
+            return None
     
     async def _run_pylint(
         self,
-        files: List[Dict[str, Any]],
-        file_contents: Dict[str, str],
-    ) -> List[LintIssue]:
+        temp_files: List[tuple],
+    ) -> Optional[List[LintIssue]]:
         """
         Run pylint on Python files.
         
         Args:
-            files: List of Python file metadata
-            file_contents: File contents mapping
+            temp_files: List of (temp_path, original_filename) tuples
         
         Returns:
-            List[LintIssue]: Pylint issues
+            Optional[List[LintIssue]]: Pylint issues, or None if pylint
+                could not run or its output could not be parsed
         """
         issues = []
         
-        # Create temporary directory for files
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Write files to temp directory
-            temp_files = []
-            for file_meta in files:
-                filename = file_meta['filename']
-                if filename not in file_contents:
-                    continue
-                
-                # Create file path
-                temp_path = os.path.join(tmpdir, os.path.basename(filename))
-                
-                with open(temp_path, 'w') as f:
-                    f.write(file_contents[filename])
-                
-                temp_files.append((temp_path, filename))
+        try:
+            cmd = [
+                'pylint',
+                '--output-format=json',
+                '--disable=C0114,C0115,C0116',  # Disable docstring warnings
+            ] + [path for path, _ in temp_files]
             
-            if not temp_files:
-                return issues
+            stdout = await run_subprocess(cmd, timeout=60)
             
-            # Run pylint
-            try:
-                cmd = [
-                    'pylint',
-                    '--output-format=json',
-                    '--disable=C0114,C0115,C0116',  # Disable docstring warnings
-                ] + [path for path, _ in temp_files]
-                
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
-                
-                # Parse pylint output
-                if result.stdout:
-                    try:
-                        pylint_data = json.loads(result.stdout)
+            # Parse pylint output
+            if stdout:
+                try:
+                    pylint_data = orjson.loads(stdout)
+                    
+                    # Map temp paths to original filenames
+                    path_map = {path: orig for path, orig in temp_files}
+                    
+                    for issue_data in pylint_data:
+                        temp_path = issue_data['path']
+                        original_filename = path_map.get(temp_path, temp_path)
                         
-                        # Map temp paths to original filenames
-                        path_map = {path: orig for path, orig in temp_files}
-                        
-                        for issue_data in pylint_data:
-                            temp_path = issue_data['path']
-                            original_filename = path_map.get(temp_path, temp_path)
-                            
-                            issues.append(LintIssue(
-                                file=original_filename,
-                                line=issue_data['line'],
-                                column=issue_data['column'],
-                                severity=self._map_pylint_severity(issue_data['type']),
-                                code=issue_data['message-id'],
-                                message=issue_data['message'],
-                                tool='pylint',
-                            ))
-                    except json.JSONDecodeError:
-                        pass
-                
-            except subprocess.TimeoutExpired:
-                logger.warning("Pylint timed out")
-            except FileNotFoundError:
-                logger.warning("Pylint not installed")
-            except Exception as e:
-                logger.error(f"Pylint error: {e}")
+                        issues.append(LintIssue(
+                            file=original_filename,
+                            line=issue_data['line'],
+                            column=issue_data['column'],
+                            severity=self._map_pylint_severity(issue_data['type']),
+                            code=issue_data['message-id'],
+                            message=issue_data['message'],
+                            tool='pylint',
+                        ))
+                except orjson.JSONDecodeError:
+                    return None
+            
+        except asyncio.TimeoutError:
+            logger.warning("Pylint timed out")
+            return None
+        except FileNotFoundError:
+            logger.warning("Pylint not installed")
+            return None
+        except Exception as e:
+            logger.error(f"Pylint error: {e}")
+            return None
         
         return issues
     
@@ -320,14 +412,7 @@ class LintingAnalyzer:
         Returns:
             LintSeverity: Mapped severity
         """
-        if code.startswith('E'):
-            return LintSeverity.ERROR
-        elif code.startswith('W'):
-            return LintSeverity.WARNING
-        elif code.startswith('F'):
-            return LintSeverity.ERROR
-        else:
-            return LintSeverity.INFO
+        return _FLAKE8_SEVERITY_BY_PREFIX.get(code[:1], LintSeverity.INFO)
     
     def _map_pylint_severity(self, pylint_type: str) -> LintSeverity:
         """
@@ -339,15 +424,7 @@ class LintingAnalyzer:
         Returns:
             LintSeverity: Mapped severity
         """
-        severity_map = {
-            'error': LintSeverity.ERROR,
-            'warning': LintSeverity.WARNING,
-            'refactor': LintSeverity.INFO,
-            'convention': LintSeverity.STYLE,
-            'info': LintSeverity.INFO,
-        }
-        
-        return severity_map.get(pylint_type.lower(), LintSeverity.INFO)
+        return _PYLINT_SEVERITY_BY_TYPE.get(pylint_type.lower(), LintSeverity.INFO)
     
     def _count_by_severity(self) -> Dict[str, int]:
         """
@@ -356,12 +433,12 @@ class LintingAnalyzer:
         Returns:
             Dict[str, int]: Severity -> count mapping
         """
-        counts = {sev.value: 0 for sev in LintSeverity}
-        
-        for issue in self.issues:
-            counts[issue.severity.value] += 1
+        if self._severity_counts is None:
+            counts = Counter(issue.severity for issue in self.issues)
+            
+            self._severity_counts = {sev.value: counts[sev] for sev in LintSeverity}
         
-        return counts
+        return dict(self._severity_counts)
     
     def get_critical_issues(self) -> List[LintIssue]:
         """
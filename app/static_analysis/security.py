@@ -6,19 +6,36 @@ Integrates with security scanning tools:
 - npm audit for JavaScript dependencies (optional)
 """
 
-import subprocess
-import json
+import asyncio
 import logging
 import tempfile
 import os
 from typing import List, Dict, Any, Optional
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 
+import orjson
+
 from app.config import settings
+from app.static_analysis._helpers import ResultCache, temp_name
+from app.static_analysis._subprocess import run_subprocess
 
 logger = logging.getLogger(__name__)
 
+# Bandit's Python API logs per-file notices (e.g. unresolved module names)
+# that the CLI would print; keep only real errors. Set once here rather than
+# per scan, since the logger is process-wide.
+logging.getLogger('bandit').setLevel(logging.ERROR)
+
+# Per-process Bandit timeout, in seconds
+_BANDIT_TIMEOUT_SECONDS = 60
+
+# Bandit issues per (severity level, filename, content hash). Module-level
+# because a SecurityAnalyzer is built per review, so a per-instance cache would
+# never see the re-review it exists for.
+_issue_cache = ResultCache()
+
 
 class SecuritySeverity(Enum):
     """Security issue severity levels."""
@@ -28,7 +45,19 @@ class SecuritySeverity(Enum):
     CRITICAL = "CRITICAL"
 
 
-@dataclass
+# Bandit severity string -> SecuritySeverity, covering the casings seen in
+# practice so findings need no .upper() or try/except
+_SEVERITY_BY_NAME = {
+    name: sev
+    for sev in SecuritySeverity
+    for name in (sev.value, sev.value.lower(), sev.value.title())
+}
+
+# Severities reported by get_critical_issues()
+_CRITICAL_SEVERITIES = frozenset({SecuritySeverity.CRITICAL, SecuritySeverity.HIGH})
+
+
+@dataclass(slots=True)
 class SecurityIssue:
     """Represents a security finding."""
     file: str
@@ -53,6 +82,7 @@ class SecurityAnalyzer:
     def __init__(self):
         """Initialize security analyzer."""
         self.issues: List[SecurityIssue] = []
+        self._reset_indexes()
     
     async def analyze(
         self,
@@ -74,6 +104,7 @@ class SecurityAnalyzer:
             return []
         
         self.issues = []
+        self._reset_indexes()
         
         # Group files by language
         python_files = [
@@ -107,98 +138,248 @@ class SecurityAnalyzer:
             files: List of Python file metadata
             file_contents: File contents mapping
         """
-        # Create temporary directory for files
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Write files to temp directory
-            temp_files = []
-            for file_meta in files:
-                filename = file_meta['filename']
-                if filename not in file_contents:
-                    continue
-                
-                # Create file path
-                temp_path = os.path.join(tmpdir, os.path.basename(filename))
-                
-                with open(temp_path, 'w') as f:
-                    f.write(file_contents[filename])
-                
-                temp_files.append((temp_path, filename))
-            
-            if not temp_files:
-                return
+        # Report findings at the configured severity or above
+        severity_level = settings.BANDIT_SEVERITY_LEVEL.upper()
+        if severity_level not in ('LOW', 'MEDIUM', 'HIGH'):
+            severity_level = 'MEDIUM'
+        
+        # Serve unchanged files from the cache; the rest need scanning
+        pending = []
+        cache_keys = {}
+        for file_meta in files:
+            filename = file_meta['filename']
+            if filename not in file_contents:
+                continue
             
-            # Run bandit
-            try:
+            content = file_contents[filename]
+            # Encoded once: hashed here, then piped or written as-is
+            data = content.encode('utf-8')
+            # Findings depend on the severity level, so it is part of the key
+            cache_key = (severity_level, *ResultCache.key(filename, data))
+            cached = _issue_cache.get(cache_key)
+            if cached is not None:
+                for issue in cached:
+                    self._add_issue(issue)
+                continue
+            cache_keys[filename] = cache_key
+            pending.append((filename, data))
+        
+        if not pending:
+            return
+        
+        # Prefer Bandit's Python API: no interpreter start-up or plugin
+        # loading per scan, and no JSON round trip. Each shard is a list of
+        # (path Bandit reports, filename).
+        with tempfile.TemporaryDirectory(prefix='sa-') as tmpdir:
+            findings = await asyncio.to_thread(
+                self._scan_in_process, tmpdir, pending, severity_level
+            )
+            if findings is not None:
+                shards = [[(filename, filename) for filename, _ in pending]]
+                shard_results = [findings]
+            else:
                 cmd = [
                     'bandit',
                     '-f', 'json',
-                    '-r', tmpdir,
-                    '-ll',  # Only low level and above
+                    '--severity-level', severity_level.lower(),
+                    '-q',  # No banner/progress output
+                    # One line of context per finding; the snippet is not used,
+                    # and it dominates the size of the buffered JSON report
+                    '-n', '1',
                 ]
                 
-                # Set severity level from config
-                severity_level = settings.BANDIT_SEVERITY_LEVEL.upper()
-                if severity_level in ['LOW', 'MEDIUM', 'HIGH']:
-                    cmd.extend(['-ll' if severity_level == 'LOW' else '-l'])
-                
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
-                
-                # Parse bandit output (it returns non-zero on findings)
-                if result.stdout:
-                    try:
-                        bandit_data = json.loads(result.stdout)
-                        
-                        # Map temp paths to original filenames
-                        path_map = {}
-                        for temp_path, original in temp_files:
-                            # Bandit uses absolute paths
-                            abs_temp_path = os.path.abspath(temp_path)
-                            path_map[abs_temp_path] = original
-                        
-                        # Parse results
-                        for finding in bandit_data.get('results', []):
-                            # Map to original filename
-                            temp_file = finding['filename']
-                            original_file = path_map.get(temp_file, temp_file)
-                            
-                            # Parse severity
-                            severity_str = finding.get('issue_severity', 'MEDIUM').upper()
-                            try:
-                                severity = SecuritySeverity[severity_str]
-                            except KeyError:
-                                severity = SecuritySeverity.MEDIUM
-                            
-                            self.issues.append(SecurityIssue(
-                                file=original_file,
-                                line=finding['line_number'],
-                                severity=severity,
-                                confidence=finding.get('issue_confidence', 'MEDIUM'),
-                                issue_type=finding.get('test_name', 'Unknown'),
-                                issue_text=finding.get('issue_text', ''),
-                                test_id=finding.get('test_id', ''),
-                                tool='bandit',
-                                more_info=finding.get('more_info'),
-                            ))
-                        
-                        logger.info(
-                            "Bandit scan completed",
-                            extra={"findings": len(bandit_data.get('results', []))}
-                        )
-                        
-                    except json.JSONDecodeError:
-                        logger.error("Failed to parse Bandit JSON output")
-                
-            except subprocess.TimeoutExpired:
-                logger.warning("Bandit scan timed out")
-            except FileNotFoundError:
-                logger.warning("Bandit not installed")
-            except Exception as e:
-                logger.error(f"Bandit error: {e}", exc_info=True)
+                # Bandit is single-threaded, so files are scanned in concurrent
+                # processes
+                max_shards = os.cpu_count() or 1
+                if len(pending) <= max_shards:
+                    # One process per file either way, so pipe each file over
+                    # stdin instead of writing temp files
+                    shards = [[('<stdin>', filename)] for filename, _ in pending]
+                    shard_results = await asyncio.gather(*(
+                        self._run_bandit_shard(cmd + ['-'], data)
+                        for _, data in pending
+                    ))
+                else:
+                    temp_files = self._write_temp_files(tmpdir, pending)
+                    
+                    # Shard the files round-robin
+                    shards = [temp_files[i::max_shards] for i in range(max_shards)]
+                    shard_results = await asyncio.gather(*(
+                        self._run_bandit_shard(cmd + [path for path, _ in shard])
+                        for shard in shards
+                    ))
+        
+        finding_count = 0
+        for shard, findings in zip(shards, shard_results):
+            if findings is None:
+                continue
+            
+            # Map reported paths to original filenames
+            path_map = dict(shard)
+            
+            # Every file in a successful shard gets a cache entry, even
+            # when it has no findings
+            shard_issues = {filename: [] for _, filename in shard}
+            for finding in findings:
+                # Map to original filename
+                temp_file = finding['filename']
+                original_file = path_map.get(temp_file, temp_file)
+                issue = self._parse_finding(finding, original_file)
+                self._add_issue(issue)
+                shard_issues.setdefault(original_file, []).append(issue)
+            
+            for filename, issues in shard_issues.items():
+                if filename in cache_keys:
+                    _issue_cache.put(cache_keys[filename], issues)
+            finding_count += len(findings)
+        
+        logger.info(
+            "Bandit scan completed",
+            extra={"findings": finding_count, "shards": len(shards)}
+        )
+    
+    def _write_temp_files(self, tmpdir: str, sources: List[tuple]) -> List[tuple]:
+        """
+        Write sources into tmpdir for Bandit to scan.
+        
+        Args:
+            tmpdir: Temporary directory
+            sources: List of (filename, UTF-8 content bytes) tuples
+        
+        Returns:
+            List[tuple]: (absolute temp_path, filename) tuples; the absolute
+                form matches the paths Bandit reports as-is
+        """
+        tmpdir = os.path.abspath(tmpdir)
+        temp_files = []
+        for filename, data in sources:
+            temp_path = f"{tmpdir}/{temp_name(filename)}"
+            
+            # Unbuffered write of the already-encoded bytes
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            
+            temp_files.append((temp_path, filename))
+        
+        return temp_files
+    
+    def _scan_in_process(
+        self,
+        tmpdir: str,
+        sources: List[tuple],
+        severity_level: str,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Scan sources with Bandit's Python API (blocking; run in a thread).
+        
+        Args:
+            tmpdir: Directory to write the sources into
+            sources: List of (filename, UTF-8 content bytes) tuples
+            severity_level: Lowest severity to report (LOW, MEDIUM or HIGH)
+        
+        Returns:
+            Optional[List[Dict[str, Any]]]: Findings in Bandit's JSON result
+                shape, keyed by original filename, or None if Bandit can't be
+                imported or the scan failed
+        """
+        try:
+            from bandit.core import config as b_config
+            from bandit.core import docs_utils
+            from bandit.core import manager as b_manager
+        except ImportError:
+            return None
+        
+        try:
+            path_map = dict(self._write_temp_files(tmpdir, sources))
+            
+            mgr = b_manager.BanditManager(b_config.BanditConfig(), 'file', quiet=True)
+            mgr.discover_files(list(path_map))
+            mgr.run_tests()
+            issues = mgr.get_issue_list(sev_level=severity_level, conf_level='UNDEFINED')
+        except Exception as e:
+            logger.error(f"Bandit error: {e}", exc_info=True)
+            return None
+        
+        findings = []
+        for issue in issues:
+            finding = issue.as_dict(with_code=False)
+            finding['filename'] = path_map.get(issue.fname, issue.fname)
+            finding['more_info'] = docs_utils.get_url(issue.test_id)
+            findings.append(finding)
+        
+        return findings
+    
+    def _reset_indexes(self):
+        """Clear the per-severity/file/type indexes kept alongside self.issues."""
+        self._by_severity: Dict[str, int] = {sev.value: 0 for sev in SecuritySeverity}
+        self._by_file: Dict[str, List[SecurityIssue]] = defaultdict(list)
+        self._by_type: Dict[str, List[SecurityIssue]] = defaultdict(list)
+        self._critical: List[SecurityIssue] = []
+    
+    def _add_issue(self, issue: SecurityIssue):
+        """Append an issue to self.issues and update the indexes."""
+        self.issues.append(issue)
+        self._by_severity[issue.severity.value] += 1
+        self._by_file[issue.file].append(issue)
+        self._by_type[issue.issue_type].append(issue)
+        if issue.severity in _CRITICAL_SEVERITIES:
+            self._critical.append(issue)
+    
+    def _parse_finding(self, finding: Dict[str, Any], original_file: str) -> SecurityIssue:
+        """Build a SecurityIssue from one entry of Bandit's JSON results."""
+        return SecurityIssue(
+            file=original_file,
+            line=finding['line_number'],
+            severity=_SEVERITY_BY_NAME.get(
+                finding.get('issue_severity'), SecuritySeverity.MEDIUM
+            ),
+            confidence=finding.get('issue_confidence', 'MEDIUM'),
+            issue_type=finding.get('test_name', 'Unknown'),
+            issue_text=finding.get('issue_text', ''),
+            test_id=finding.get('test_id', ''),
+            tool='bandit',
+            more_info=finding.get('more_info'),
+        )
+    
+    async def _run_bandit_shard(
+        self,
+        cmd: List[str],
+        stdin: Optional[bytes] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Run one Bandit process over a shard of files.
+        
+        Args:
+            cmd: Bandit command, including the files to scan
+            stdin: Source to scan when cmd reads it from stdin ('-')
+        
+        Returns:
+            Optional[List[Dict[str, Any]]]: Raw Bandit findings, or None if
+                the scan failed
+        """
+        try:
+            stdout = await run_subprocess(cmd, _BANDIT_TIMEOUT_SECONDS, stdin)
+            
+            # Parse bandit output (it returns non-zero on findings)
+            if stdout:
+                try:
+                    return orjson.loads(stdout).get('results', [])
+                except orjson.JSONDecodeError:
+                    logger.error("Failed to parse Bandit JSON output")
+            
+        except asyncio.TimeoutError:
+            logger.warning("Bandit scan timed out")
+        except FileNotFoundError:
+            logger.warning("Bandit not installed")
+        except Exception as e:
+            logger.error(f"Bandit error: {e}", exc_info=True)
+        
+        return None
     
     def _count_by_severity(self) -> Dict[str, int]:
         """
@@ -207,12 +388,7 @@ class SecurityAnalyzer:
         Returns:
             Dict[str, int]: Severity -> count mapping
         """
-        counts = {sev.value: 0 for sev in SecuritySeverity}
-        
-        for issue in self.issues:
-            counts[issue.severity.value] += 1
-        
-        return counts
+        return dict(self._by_severity)
     
     def get_critical_issues(self) -> List[SecurityIssue]:
         """
@@ -221,10 +397,7 @@ class SecurityAnalyzer:
         Returns:
             List[SecurityIssue]: Critical/high issues
         """
-        return [
-            issue for issue in self.issues 
-            if issue.severity in [SecuritySeverity.CRITICAL, SecuritySeverity.HIGH]
-        ]
+        return list(self._critical)
     
     def get_issues_by_file(self) -> Dict[str, List[SecurityIssue]]:
         """
@@ -233,14 +406,7 @@ class SecurityAnalyzer:
         Returns:
             Dict[str, List[SecurityIssue]]: File -> issues mapping
         """
-        by_file = {}
-        
-        for issue in self.issues:
-            if issue.file not in by_file:
-                by_file[issue.file] = []
-            by_file[issue.file].append(issue)
-        
-        return by_file
+        return {k: list(v) for k, v in self._by_file.items()}
     
     def get_issues_by_type(self) -> Dict[str, List[SecurityIssue]]:
         """
@@ -249,14 +415,7 @@ class SecurityAnalyzer:
         Returns:
             Dict[str, List[SecurityIssue]]: Type -> issues mapping
         """
-        by_type = {}
-        
-        for issue in self.issues:
-            if issue.issue_type not in by_type:
-                by_type[issue.issue_type] = []
-            by_type[issue.issue_type].append(issue)
-        
-        return by_type
+        return {k: list(v) for k, v in self._by_type.items()}
     
     def has_critical_findings(self) -> bool:
         """
@@ -265,7 +424,7 @@ class SecurityAnalyzer:
         Returns:
             bool: True if critical findings exist
         """
-        return len(self.get_critical_issues()) > 0
+        return bool(self._critical)
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -274,14 +433,12 @@ class SecurityAnalyzer:
         Returns:
             Dict: Security summary
         """
-        critical_issues = self.get_critical_issues()
-        
         return {
             "total_issues": len(self.issues),
             "by_severity": self._count_by_severity(),
-            "critical_count": len(critical_issues),
-            "files_with_issues": len(self.get_issues_by_file()),
-            "issue_types": list(self.get_issues_by_type().keys()),
+            "critical_count": len(self._critical),
+            "files_with_issues": len(self._by_file),
+            "issue_types": list(self._by_type),
             "has_critical": self.has_critical_findings(),
         }
     
@@ -295,11 +452,11 @@ class SecurityAnalyzer:
         Returns:
             str: Formatted issue message
         """
-        msg = f"**[{issue.severity.value}]** {issue.issue_type}\n\n"
-        msg += f"{issue.issue_text}\n\n"
-        msg += f"Confidence: {issue.confidence}\n"
-        
-        if issue.more_info:
-            msg += f"\nMore info: {issue.more_info}"
+        more_info = f"\nMore info: {issue.more_info}" if issue.more_info else ""
         
-        return msg
\ No newline at end of file
+        return (
+            f"**[{issue.severity.value}]** {issue.issue_type}\n\n"
+            f"{issue.issue_text}\n\n"
+            f"Confidence: {issue.confidence}\n"
+            f"{more_info}"
+        )
\ No newline at end of file
@@ -5,10 +5,12 @@ Provides a high-level interface for storing and retrieving review records,
 abstracting the underlying storage mechanism (S3, database, etc.).
 """
 
+import asyncio
 import logging
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from enum import Enum
 
 from app.storage.s3 import S3Client
@@ -16,6 +18,9 @@ from app.llm.schemas import CodeReview, ReviewRecommendation
 
 logger = logging.getLogger(__name__)
 
+# Maximum in-flight review downloads when computing repository stats
+_STATS_DOWNLOAD_CONCURRENCY = 32
+
 
 class ReviewStatus(str, Enum):
     """Status of a review."""
@@ -25,7 +30,11 @@ class ReviewStatus(str, Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Serialized value -> ReviewStatus
+_STATUS_BY_VALUE = {status.value: status for status in ReviewStatus}
+
+
+@dataclass(slots=True)
 class ReviewRecord:
     """
     Record of a PR review.
@@ -66,7 +75,8 @@ class ReviewRecord:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        data = asdict(self)
+        # Shallow field copy; asdict() would deep-copy review_data as well
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
         # Convert datetime to ISO format
         data['created_at'] = self.created_at.isoformat()
         data['updated_at'] = self.updated_at.isoformat()
@@ -81,7 +91,8 @@ class ReviewRecord:
         data['created_at'] = datetime.fromisoformat(data['created_at'])
         data['updated_at'] = datetime.fromisoformat(data['updated_at'])
         # Convert string to enum
-        data['status'] = ReviewStatus(data['status'])
+        status = data['status']
+        data['status'] = _STATUS_BY_VALUE.get(status) or ReviewStatus(status)
         return cls(**data)
 
 
@@ -179,7 +190,83 @@ class ReviewRepository:
         Returns:
             Updated record with saved data
         """
-        # Update record with results
+        self._apply_review_result(record, review_result, processing_time_ms)
+        
+        # Upload to S3
+        s3_key = await self._upload_review(record, review_result)
+        self._apply_s3_key(record, s3_key)
+        
+        return record
+    
+    async def save_logs(
+        self,
+        record: ReviewRecord,
+        log_data: str,
+    ) -> ReviewRecord:
+        """
+        Save log data for a review.
+        
+        Args:
+            record: Review record
+            log_data: Log content
+        
+        Returns:
+            Updated record
+        """
+        log_key = await self._upload_logs(record, log_data)
+        self._apply_log_key(record, log_key)
+        
+        return record
+    
+    async def save_completed(
+        self,
+        record: ReviewRecord,
+        review_result: Dict[str, Any],
+        log_data: str,
+        processing_time_ms: int,
+    ) -> ReviewRecord:
+        """
+        Save a completed review result and its logs in one step.
+        
+        The review and log uploads are independent, so they are issued
+        concurrently; a failure in one does not affect the other.
+        
+        Args:
+            record: Review record
+            review_result: Complete review result from PRReviewer
+            log_data: Log content
+            processing_time_ms: Processing time in milliseconds
+        
+        Returns:
+            Updated record with saved data
+        """
+        self._apply_review_result(record, review_result, processing_time_ms)
+        
+        s3_key, log_key = await asyncio.gather(
+            self._upload_review(record, review_result),
+            self._upload_logs(record, log_data),
+            return_exceptions=True,
+        )
+        
+        if isinstance(s3_key, Exception):
+            logger.error(f"Review upload raised: {s3_key}")
+            s3_key = None
+        self._apply_s3_key(record, s3_key)
+        
+        if isinstance(log_key, Exception):
+            logger.error(f"Log upload raised: {log_key}")
+            log_key = None
+        self._apply_log_key(record, log_key)
+        
+        return record
+    
+    def _apply_review_result(
+        self,
+        record: ReviewRecord,
+        review_result: Dict[str, Any],
+        processing_time_ms: int,
+    ):
+        """Update record fields from a completed review result."""
         record.status = ReviewStatus.COMPLETED
         record.updated_at = datetime.utcnow()
         record.review_data = review_result
@@ -196,52 +283,53 @@ class ReviewRepository:
             else:
                 # CodeReview object
                 record.comment_count = len(review.comments)
-        
-        # Upload to S3
-        s3_key = await self.s3_client.upload_review(
+    
+    async def _upload_review(
+        self,
+        record: ReviewRecord,
+        review_result: Dict[str, Any],
+    ) -> Optional[str]:
+        """Upload review data for a record, returning the S3 key."""
+        # The review result doesn't carry its processing time; store it in
+        # the document so get_review_stats can average it
+        return await self.s3_client.upload_review(
             owner=record.owner,
             repo=record.repo,
             pr_number=record.pr_number,
-            review_data=review_result,
+            review_data={
+                **review_result,
+                "processing_time_ms": record.processing_time_ms,
+            },
             timestamp=record.updated_at,
         )
-        
-        if s3_key:
-            record.s3_key = s3_key
-            logger.info(f"Review saved to S3: {s3_key}")
-        else:
-            logger.warning("Failed to save review to S3")
-        
-        return record
     
-    async def save_logs(
+    async def _upload_logs(
         self,
         record: ReviewRecord,
         log_data: str,
-    ) -> ReviewRecord:
-        """
-        Save log data for a review.
-        
-        Args:
-            record: Review record
-            log_data: Log content
-        
-        Returns:
-            Updated record
-        """
-        log_key = await self.s3_client.upload_logs(
+    ) -> Optional[str]:
+        """Upload log data for a record, returning the S3 key."""
+        return await self.s3_client.upload_logs(
             owner=record.owner,
             repo=record.repo,
             pr_number=record.pr_number,
             log_data=log_data,
             timestamp=record.updated_at,
         )
-        
+    
+    def _apply_s3_key(self, record: ReviewRecord, s3_key: Optional[str]):
+        """Record the review upload's S3 key on the record."""
+        if s3_key:
+            record.s3_key = s3_key
+            logger.info(f"Review saved to S3: {s3_key}")
+        else:
+            logger.warning("Failed to save review to S3")
+    
+    def _apply_log_key(self, record: ReviewRecord, log_key: Optional[str]):
+        """Record the log upload's S3 key on the record."""
         if log_key:
             record.log_key = log_key
             logger.info(f"Logs saved to S3: {log_key}")
-        
-        return record
     
     async def get_review(
         self,
@@ -357,13 +445,13 @@ class ReviewRepository:
             logger.warning("No S3 key found for review")
             return False
         
-        success = await self.s3_client.delete_review(record.s3_key)
-        
-        # Also delete logs if present
+        # Delete the review and its logs (if present) in one request
+        keys = [record.s3_key]
         if record.log_key:
-            await self.s3_client.delete_review(record.log_key)
+            keys.append(record.log_key)
+        deleted, _ = await self.s3_client.delete_reviews(keys)
         
-        return success
+        return record.s3_key in deleted
     
     async def get_review_stats(
         self,
@@ -391,21 +479,64 @@ class ReviewRepository:
                 "recommendation_breakdown": {},
             }
         
-        # Filter by date if provided
-        if since:
-            reviews = [
-                r for r in reviews
-                if r['last_modified'] >= since
-            ]
+        # Filter by date and calculate listing statistics in a single pass
+        selected = []
+        storage_size = 0
+        earliest = latest = None
+        for r in reviews:
+            last_modified = r['last_modified']
+            if since and last_modified < since:
+                continue
+            selected.append(r)
+            storage_size += r['size']
+            if earliest is None or last_modified < earliest:
+                earliest = last_modified
+            if latest is None or last_modified > latest:
+                latest = last_modified
+        
+        # Download the selected reviews concurrently (bounded) for the
+        # content-level statistics. With S3 Select only the two fields used
+        # here are transferred; objects it can't read (e.g. plain-JSON uploads
+        # from before compression) fall back to a full download.
+        semaphore = asyncio.Semaphore(_STATS_DOWNLOAD_CONCURRENCY)
+        use_select = self.s3_client.settings.S3_SELECT_ENABLED
+        
+        async def download(key: str) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                if use_select:
+                    selected_fields = await self.s3_client.select_review_fields(key)
+                    if selected_fields is not None:
+                        return selected_fields
+                return await self.s3_client.download_review(key)
+        
+        blobs = await asyncio.gather(*(download(r['key']) for r in selected))
+        
+        recommendation_breakdown = Counter()
+        processing_time_total = 0
+        processing_time_count = 0
+        for blob in blobs:
+            if not blob:
+                continue
+            recommendation = blob.get("recommendation")
+            if isinstance(recommendation, dict):
+                recommendation = recommendation.get("value")
+            if recommendation:
+                recommendation_breakdown[recommendation] += 1
+            if blob.get("processing_time_ms"):
+                processing_time_total += blob["processing_time_ms"]
+                processing_time_count += 1
         
-        # Calculate statistics
-        # Note: This is simplified. In production, you'd download and analyze each review
         stats = {
-            "total_reviews": len(reviews),
-            "storage_size_bytes": sum(r['size'] for r in reviews),
+            "total_reviews": len(selected),
+            "storage_size_bytes": storage_size,
+            "avg_processing_time_ms": (
+                processing_time_total / processing_time_count
+                if processing_time_count else 0
+            ),
+            "recommendation_breakdown": dict(recommendation_breakdown),
             "date_range": {
-                "earliest": min(r['last_modified'] for r in reviews).isoformat() if reviews else None,
-                "latest": max(r['last_modified'] for r in reviews).isoformat() if reviews else None,
+                "earliest": earliest.isoformat() if earliest else None,
+                "latest": latest.isoformat() if latest else None,
             }
         }
         
@@ -5,16 +5,158 @@ Handles uploading review results, logs, and artifacts to S3 for
 persistence, audit trails, and analytics.
 """
 
-import json
+import asyncio
+import gzip
 import logging
 from datetime import datetime
-from typing import Dict, Optional, Any, BinaryIO
+from typing import Dict, List, Optional, Any, BinaryIO, Tuple
 from io import BytesIO
 
+import orjson
+
 from app.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# gzip level for review and log uploads: level 3 gets most of level 9's ratio on
+# JSON at a fraction of the CPU cost
+_GZIP_LEVEL = 3
+
+# Bodies at least this large are (de)compressed in a worker thread so the
+# event loop isn't blocked; below it the thread hop costs more than it saves
+_INLINE_COMPRESS_MAX_BYTES = 32 * 1024
+
+# Uploads of at least settings.S3_MULTIPART_THRESHOLD bytes (8 MiB by
+# default) use multipart, in parts of _MULTIPART_CHUNKSIZE sent up to
+# _MULTIPART_MAX_CONCURRENCY at a time. Anything smaller is a plain
+# put_object, avoiding the extra create/complete round trips.
+_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+_MULTIPART_MAX_CONCURRENCY = 10
+
+# Most keys S3 returns per list_objects_v2 page
+_LIST_PAGE_SIZE = 1000
+
+# Most keys S3 accepts per delete_objects call
+_DELETE_BATCH_SIZE = 1000
+
+
+# boto3 clients shared by every S3Client with the same credentials/region.
+# S3Client is built per request, and a fresh boto3 client would mean a fresh
+# connection pool (and new TLS handshakes) each time.
+_shared_clients: Dict[tuple, Any] = {}
+_shared_session = None
+# One in-flight cap per event loop: an asyncio.Semaphore is bound to the loop
+# it is first used on, and processes may run several loops over their life
+# (asyncio.run per job, tests). Not a WeakKeyDictionary: a semaphore that has
+# had waiters references its loop, which would keep the key alive. Closed
+# loops are pruned instead whenever a new loop's semaphore is created.
+_shared_semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+# Recently downloaded review bodies, stored as fetched (gzipped) with their
+# ETag and keyed by (bucket, key). Repeat downloads send a conditional GET and
+# reuse the cached body on 304 instead of transferring it again. Entries are
+# evicted least recently used first once the total exceeds the byte budget.
+# Only touched from the event loop thread.
+_REVIEW_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_review_cache: Dict[tuple, tuple] = {}
+_review_cache_bytes = 0
+
+
+def _get_shared_client(settings: Settings):
+    """
+    Return the process-wide boto3 S3 client for these settings.
+    
+    Raises:
+        ImportError: If boto3 is not installed
+    """
+    global _shared_session
+    
+    cache_key = (
+        settings.AWS_ACCESS_KEY_ID,
+        settings.AWS_SECRET_ACCESS_KEY,
+        settings.AWS_REGION,
+    )
+    client = _shared_clients.get(cache_key)
+    if client is None:
+        import boto3
+        from botocore.config import Config
+        
+        if _shared_session is None:
+            _shared_session = boto3.session.Session()
+        client = _shared_session.client(
+            's3',
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+            config=Config(
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                retries={'mode': 'standard'},
+                tcp_keepalive=True,
+            ),
+        )
+        _shared_clients[cache_key] = client
+    
+    return client
+
+
+def _get_shared_semaphore(settings: Settings) -> asyncio.Semaphore:
+    """Return the running loop's cap on in-flight S3 operations."""
+    loop = asyncio.get_running_loop()
+    semaphore = _shared_semaphores.get(loop)
+    if semaphore is None:
+        for closed in [other for other in _shared_semaphores if other.is_closed()]:
+            del _shared_semaphores[closed]
+        semaphore = _shared_semaphores[loop] = asyncio.Semaphore(
+            settings.S3_MAX_CONCURRENCY
+        )
+    return semaphore
+
+
+async def _compress(data: bytes) -> bytes:
+    """gzip an upload body, off the event loop when it is large."""
+    if len(data) < _INLINE_COMPRESS_MAX_BYTES:
+        return gzip.compress(data, compresslevel=_GZIP_LEVEL)
+    return await asyncio.to_thread(gzip.compress, data, compresslevel=_GZIP_LEVEL)
+
+
+def _parse_review(body: bytes, gzipped: bool) -> Dict[str, Any]:
+    """Parse a review body; reviews are stored gzipped, older ones plain JSON."""
+    return orjson.loads(gzip.decompress(body) if gzipped else body)
+
+
+async def _decode_review(body: bytes, gzipped: bool) -> Dict[str, Any]:
+    """Parse a review body, off the event loop when it is large."""
+    if len(body) < _INLINE_COMPRESS_MAX_BYTES:
+        return _parse_review(body, gzipped)
+    return await asyncio.to_thread(_parse_review, body, gzipped)
+
+
+def _cache_review(cache_key: tuple, entry: tuple):
+    """Cache a fetched (etag, gzipped, body) entry, evicting LRU entries."""
+    global _review_cache_bytes
+    
+    if not entry[0] or len(entry[2]) > _REVIEW_CACHE_MAX_BYTES:
+        return
+    
+    previous = _review_cache.pop(cache_key, None)
+    if previous is not None:
+        _review_cache_bytes -= len(previous[2])
+    
+    _review_cache[cache_key] = entry
+    _review_cache_bytes += len(entry[2])
+    while _review_cache_bytes > _REVIEW_CACHE_MAX_BYTES:
+        evicted = _review_cache.pop(next(iter(_review_cache)))
+        _review_cache_bytes -= len(evicted[2])
+
+
+def _evict_review(bucket_name: str, key: str):
+    """Drop a review from the download cache."""
+    global _review_cache_bytes
+    
+    entry = _review_cache.pop((bucket_name, key), None)
+    if entry is not None:
+        _review_cache_bytes -= len(entry[2])
+
 
 class S3Error(Exception):
     """Exception raised for S3 operation errors."""
@@ -39,15 +181,18 @@ class S3Client:
         self.settings = settings
         self.bucket_name = settings.S3_BUCKET_NAME
         self.enabled = settings.S3_ENABLED
+        self.multipart_threshold = settings.S3_MULTIPART_THRESHOLD
         
         if self.enabled:
             try:
-                import boto3
-                self.client = boto3.client(
-                    's3',
-                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                    region_name=settings.AWS_REGION,
+                from boto3.s3.transfer import TransferConfig
+                self.client = _get_shared_client(settings)
+                # Large bodies are split into parts uploaded in parallel
+                self._transfer_config = TransferConfig(
+                    multipart_threshold=self.multipart_threshold,
+                    multipart_chunksize=_MULTIPART_CHUNKSIZE,
+                    max_concurrency=_MULTIPART_MAX_CONCURRENCY,
+                    use_threads=True,
                 )
                 logger.info(f"S3 client initialized for bucket: {self.bucket_name}")
             except ImportError:
@@ -90,15 +235,22 @@ class S3Client:
             timestamp = timestamp or datetime.utcnow()
             key = self._generate_review_key(owner, repo, pr_number, timestamp)
             
-            # Convert to JSON
-            json_data = json.dumps(review_data, indent=2, default=str)
+            # Convert to compact JSON and compress; review JSON is highly
+            # repetitive. orjson emits UTF-8 bytes directly and handles
+            # datetimes/enums/dataclasses natively; anything else is str()'d.
+            json_data = orjson.dumps(
+                review_data,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS,
+            )
+            body = await _compress(json_data)
             
             # Upload
-            self.client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=json_data.encode('utf-8'),
+            await self._upload_bytes(
+                key,
+                body,
                 ContentType='application/json',
+                ContentEncoding='gzip',
                 Metadata={
                     'owner': owner,
                     'repo': repo,
@@ -125,6 +277,9 @@ class S3Client:
         """
         Upload log data to S3.
         
+        Logs are written as one object per review, so callers should collect a
+        review's log output and upload it once rather than per log event.
+        
         Args:
             owner: Repository owner
             repo: Repository name
@@ -142,11 +297,11 @@ class S3Client:
             timestamp = timestamp or datetime.utcnow()
             key = self._generate_log_key(owner, repo, pr_number, timestamp)
             
-            self.client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=log_data.encode('utf-8'),
+            await self._upload_bytes(
+                key,
+                await _compress(log_data.encode('utf-8')),
                 ContentType='text/plain',
+                ContentEncoding='gzip',
                 Metadata={
                     'owner': owner,
                     'repo': repo,
@@ -179,16 +334,31 @@ class S3Client:
             return None
         
         try:
-            response = self.client.get_object(
-                Bucket=self.bucket_name,
-                Key=key,
+            cache_key = (self.bucket_name, key)
+            cached = _review_cache.get(cache_key)
+            fetched = await self._run_blocking(
+                self._fetch_review,
+                key,
+                cached[0] if cached else None,
             )
             
-            content = response['Body'].read().decode('utf-8')
-            data = json.loads(content)
+            if fetched is None and cache_key in _review_cache:
+                # Not modified; reinsert the entry that was validated (not
+                # whatever another download put there meanwhile) as most
+                # recently used
+                _cache_review(cache_key, cached)
+                _, gzipped, body = cached
+                logger.info(f"Review served from cache: {key}")
+            else:
+                if fetched is None:
+                    # The entry was evicted or deleted while the request was
+                    # in flight; don't serve it, fetch the object again
+                    fetched = await self._run_blocking(self._fetch_review, key, None)
+                _cache_review(cache_key, fetched)
+                _, gzipped, body = fetched
+                logger.info(f"Review downloaded from S3: {key}")
             
-            logger.info(f"Review downloaded from S3: {key}")
-            return data
+            return await _decode_review(body, gzipped)
             
         except Exception as e:
             logger.error(f"Failed to download review from S3: {e}")
@@ -200,7 +370,7 @@ class S3Client:
         repo: str,
         pr_number: Optional[int] = None,
         limit: int = 100,
-    ) -> list[Dict[str, Any]]:
+    ) -> List[Dict[str, Any]]:
         """
         List reviews for a repository or PR.
         
@@ -223,19 +393,7 @@ class S3Client:
             else:
                 prefix = f"reviews/{owner}/{repo}/"
             
-            response = self.client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=limit,
-            )
-            
-            reviews = []
-            for obj in response.get('Contents', []):
-                reviews.append({
-                    'key': obj['Key'],
-                    'size': obj['Size'],
-                    'last_modified': obj['LastModified'],
-                })
+            reviews = await self._list_prefix(prefix, limit)
             
             logger.info(f"Found {len(reviews)} reviews for {owner}/{repo}")
             return reviews
@@ -244,6 +402,39 @@ class S3Client:
             logger.error(f"Failed to list reviews from S3: {e}")
             return []
     
+    async def select_review_fields(
+        self,
+        key: str,
+        expression: str = "SELECT s.recommendation, s.processing_time_ms FROM S3Object s",
+        gzipped: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read selected fields of a review server-side with S3 Select.
+        
+        Only the projected fields cross the network instead of the whole
+        review body.
+        
+        Args:
+            key: S3 key of the review file
+            expression: S3 Select SQL expression over the review document
+            gzipped: Whether the object is stored gzipped (reviews uploaded
+                before compression was added are plain JSON)
+        
+        Returns:
+            Selected fields, or None if failed
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            return await self._run_blocking(
+                self._select_object, key, expression, gzipped
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to select review fields from S3: {e}")
+            return None
+    
     async def upload_artifact(
         self,
         key: str,
@@ -267,17 +458,12 @@ class S3Client:
             return False
         
         try:
-            kwargs = {
-                'Bucket': self.bucket_name,
-                'Key': key,
-                'Body': data,
-                'ContentType': content_type,
-            }
+            extra_args = {'ContentType': content_type}
             
             if metadata:
-                kwargs['Metadata'] = metadata
+                extra_args['Metadata'] = metadata
             
-            self.client.put_object(**kwargs)
+            await self._upload_bytes(key, data, **extra_args)
             logger.info(f"Artifact uploaded to S3: {key}")
             return True
             
@@ -298,17 +484,219 @@ class S3Client:
         if not self.enabled:
             return False
         
+        deleted, _ = await self.delete_reviews([key])
+        return bool(deleted)
+    
+    async def delete_reviews(
+        self,
+        keys: List[str],
+    ) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        Delete reviews (or any objects) from S3 in batches.
+        
+        Keys are sent in delete_objects batches of up to 1000, concurrently,
+        instead of one DeleteObject round trip per key.
+        
+        Args:
+            keys: S3 keys to delete
+        
+        Returns:
+            Tuple of (deleted keys, errors); each error is a dict with Key,
+            Code and Message
+        """
+        if not self.enabled or not keys:
+            return [], []
+        
+        batches = [
+            keys[i:i + _DELETE_BATCH_SIZE]
+            for i in range(0, len(keys), _DELETE_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self._delete_batch(batch) for batch in batches),
+            return_exceptions=True,
+        )
+        
+        deleted = []
+        errors = []
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to delete reviews from S3: {result}")
+                errors.extend(
+                    {'Key': key, 'Code': type(result).__name__, 'Message': str(result)}
+                    for key in batch
+                )
+                continue
+            
+            # Quiet mode only reports failures; everything else was deleted
+            failed = {error['Key'] for error in result}
+            errors.extend(result)
+            deleted.extend(key for key in batch if key not in failed)
+        
+        for key in deleted:
+            _evict_review(self.bucket_name, key)
+        for error in errors:
+            logger.error(
+                f"Failed to delete {error.get('Key')} from S3: "
+                f"{error.get('Code')} {error.get('Message')}"
+            )
+        if deleted:
+            logger.info(f"Deleted {len(deleted)} objects from S3")
+        
+        return deleted, errors
+    
+    async def _delete_batch(self, keys: List[str]) -> List[Dict[str, Any]]:
+        """Delete up to 1000 keys with one delete_objects call, returning errors."""
+        response = await self._call(
+            'delete_objects',
+            Bucket=self.bucket_name,
+            Delete={
+                'Objects': [{'Key': key} for key in keys],
+                'Quiet': True,
+            },
+        )
+        return response.get('Errors', [])
+    
+    async def _run_blocking(self, func, *args, **kwargs) -> Any:
+        """
+        Run a blocking boto3 operation in a worker thread.
+        
+        boto3 is blocking, so calling it directly from these coroutines would
+        stall the event loop for the whole S3 round trip. The number of
+        operations in flight is capped process-wide so bursts don't turn into
+        S3 SlowDown throttling and retry storms.
+        """
+        async with _get_shared_semaphore(self.settings):
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
+    async def _call(self, method: str, **kwargs) -> Any:
+        """Run a boto3 client method in a worker thread."""
+        return await self._run_blocking(getattr(self.client, method), **kwargs)
+    
+    async def _upload_bytes(self, key: str, data: bytes, **extra_args):
+        """
+        Upload a body to key.
+        
+        Small bodies (the common case for reviews and logs) are a single
+        put_object. Bodies of at least multipart_threshold bytes go through
+        boto3's transfer manager as a multipart upload with parts sent in
+        parallel.
+        
+        Args:
+            key: S3 key/path
+            data: Body to upload
+            **extra_args: put_object arguments (ContentType, Metadata, ...)
+        """
+        if len(data) < self.multipart_threshold:
+            await self._call(
+                'put_object',
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=data,
+                **extra_args,
+            )
+            return
+        
+        await self._run_blocking(
+            self.client.upload_fileobj,
+            BytesIO(data),
+            self.bucket_name,
+            key,
+            ExtraArgs=extra_args,
+            Config=self._transfer_config,
+        )
+    
+    async def _list_prefix(self, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """List up to limit objects under a single prefix."""
+        return await self._run_blocking(self._list_objects, prefix, limit)
+    
+    def _list_objects(self, prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        List up to limit objects under prefix (blocking; run in a thread).
+        
+        A single list_objects_v2 call returns at most 1000 keys, so pages are
+        followed via continuation tokens until limit objects are collected.
+        """
+        paginator = self.client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig={
+                'MaxItems': limit,
+                'PageSize': min(_LIST_PAGE_SIZE, limit),
+            },
+        )
+        
+        objects = []
+        for page in pages:
+            for obj in page.get('Contents', []):
+                objects.append({
+                    'key': obj['Key'],
+                    'size': obj['Size'],
+                    'last_modified': obj['LastModified'],
+                })
+                if len(objects) >= limit:
+                    return objects
+        
+        return objects
+    
+    def _select_object(
+        self,
+        key: str,
+        expression: str,
+        gzipped: bool,
+    ) -> Optional[Dict[str, Any]]:
+        """Run an S3 Select query over a JSON document (blocking; run in a thread)."""
+        response = self.client.select_object_content(
+            Bucket=self.bucket_name,
+            Key=key,
+            ExpressionType='SQL',
+            Expression=expression,
+            InputSerialization={
+                'JSON': {'Type': 'DOCUMENT'},
+                'CompressionType': 'GZIP' if gzipped else 'NONE',
+            },
+            OutputSerialization={'JSON': {}},
+        )
+        
+        payload = b''.join(
+            event['Records']['Payload']
+            for event in response['Payload']
+            if 'Records' in event
+        )
+        # A DOCUMENT input yields at most one newline-terminated record
+        record = payload.strip()
+        return orjson.loads(record) if record else None
+    
+    def _fetch_review(
+        self,
+        key: str,
+        etag: Optional[str],
+    ) -> Optional[tuple]:
+        """
+        Fetch a review object's raw body (blocking; run in a thread).
+        
+        Returns:
+            (etag, gzipped, body), or None if etag is given and still current
+        """
+        kwargs = {'IfNoneMatch': etag} if etag else {}
         try:
-            self.client.delete_object(
+            response = self.client.get_object(
                 Bucket=self.bucket_name,
                 Key=key,
+                **kwargs,
             )
-            logger.info(f"Review deleted from S3: {key}")
-            return True
-            
         except Exception as e:
-            logger.error(f"Failed to delete review from S3: {e}")
-            return False
+            error_response = getattr(e, 'response', None) or {}
+            status = error_response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+            if etag and status == 304:
+                return None
+            raise
+        
+        return (
+            response.get('ETag'),
+            response.get('ContentEncoding') == 'gzip',
+            response['Body'].read(),
+        )
     
     def _generate_review_key(
         self,
@@ -372,6 +760,156 @@ class S3Client:
         except Exception as e:
             logger.error(f"Failed to generate presigned URL: {e}")
             return None
+    
+    def get_presigned_upload_url(
+        self,
+        key: str,
+        content_type: str = 'application/octet-stream',
+        expiration: int = 3600,
+    ) -> Optional[str]:
+        """
+        Generate presigned URL for uploading a file directly to S3.
+        
+        Lets producers PUT large artifacts straight to the bucket instead of
+        streaming them through this process. The uploader must send the same
+        Content-Type header the URL was signed with.
+        
+        Args:
+            key: S3 key
+            content_type: Content type the upload must use
+            expiration: URL expiration time in seconds (default: 1 hour)
+        
+        Returns:
+            Presigned URL, or None if failed
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            return self.client.generate_presigned_url(
+                'put_object',
+                Params={
+                    'Bucket': self.bucket_name,
+                    'Key': key,
+                    'ContentType': content_type,
+                },
+                ExpiresIn=expiration,
+            )
+            
+        except Exception as e:
+            logger.error(f"Failed to generate presigned upload URL: {e}")
+            return None
+    
+    async def create_presigned_multipart_upload(
+        self,
+        key: str,
+        num_parts: int,
+        content_type: str = 'application/octet-stream',
+        expiration: int = 3600,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Start a multipart upload and presign a PUT URL for each part.
+        
+        The uploader PUTs part N to urls[N - 1], keeps each response's ETag,
+        and hands them to complete_presigned_multipart_upload.
+        
+        Args:
+            key: S3 key
+            num_parts: Number of parts the uploader will send
+            content_type: Content type of the assembled object
+            expiration: URL expiration time in seconds (default: 1 hour)
+        
+        Returns:
+            Dict with upload_id and urls, or None if failed
+        """
+        if not self.enabled:
+            return None
+        
+        try:
+            response = await self._call(
+                'create_multipart_upload',
+                Bucket=self.bucket_name,
+                Key=key,
+                ContentType=content_type,
+            )
+            upload_id = response['UploadId']
+        except Exception as e:
+            logger.error(f"Failed to create multipart upload: {e}")
+            return None
+        
+        try:
+            urls = [
+                self.client.generate_presigned_url(
+                    'upload_part',
+                    Params={
+                        'Bucket': self.bucket_name,
+                        'Key': key,
+                        'UploadId': upload_id,
+                        'PartNumber': part_number,
+                    },
+                    ExpiresIn=expiration,
+                )
+                for part_number in range(1, num_parts + 1)
+            ]
+            return {'upload_id': upload_id, 'urls': urls}
+            
+        except Exception as e:
+            logger.error(f"Failed to presign multipart upload parts: {e}")
+            await self._abort_multipart_upload(key, upload_id)
+            return None
+    
+    async def complete_presigned_multipart_upload(
+        self,
+        key: str,
+        upload_id: str,
+        etags: List[str],
+    ) -> bool:
+        """
+        Complete a multipart upload started by create_presigned_multipart_upload.
+        
+        Args:
+            key: S3 key
+            upload_id: Upload ID returned when the upload was created
+            etags: ETag of each uploaded part, in part order
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.enabled:
+            return False
+        
+        try:
+            await self._call(
+                'complete_multipart_upload',
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    'Parts': [
+                        {'ETag': etag, 'PartNumber': part_number}
+                        for part_number, etag in enumerate(etags, start=1)
+                    ],
+                },
+            )
+            logger.info(f"Multipart upload completed: {key}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to complete multipart upload: {e}")
+            await self._abort_multipart_upload(key, upload_id)
+            return False
+    
+    async def _abort_multipart_upload(self, key: str, upload_id: str):
+        """Abort a multipart upload so its parts stop accruing storage."""
+        try:
+            await self._call(
+                'abort_multipart_upload',
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+            )
+        except Exception as e:
+            logger.error(f"Failed to abort multipart upload: {e}")
 
 
 def get_s3_client():
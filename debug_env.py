@@ -1,8 +1,25 @@
 # debug_env.py
-from dotenv import load_dotenv
-import os
+import sys
 
-load_dotenv()
+from pydantic import ValidationError
 
-print("APP_ID:", os.getenv("GITHUB_APP_ID"))
-print("WEBHOOK_SECRET:", os.getenv("GITHUB_WEBHOOK_SECRET"))
+try:
+    from app.config import settings
+except ValidationError as e:
+    # Report what's wrong with the environment instead of a traceback
+    for error in e.errors():
+        field = ".".join(str(part) for part in error["loc"])
+        if error["type"] == "missing":
+            print(f"{field}: missing (set it in the environment or .env)")
+        else:
+            print(f"{field}: {error['msg']}")
+    sys.exit(1)
+
+
+def mask(value: str) -> str:
+    """Hide a secret, showing only whether it is set and its length."""
+    return f"****** ({len(value)} chars)" if value else "<empty>"
+
+
+print("APP_ID:", settings.GITHUB_APP_ID)
+print("WEBHOOK_SECRET:", mask(settings.GITHUB_WEBHOOK_SECRET))
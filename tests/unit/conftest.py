@@ -0,0 +1,11 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+import os
+
+# app.config builds Settings at import time; give the required fields
+# placeholder values so app modules can be imported without a .env
+os.environ.setdefault("GITHUB_APP_ID", "1")
+os.environ.setdefault("GITHUB_PRIVATE_KEY", "test-key")
+os.environ.setdefault("GITHUB_WEBHOOK_SECRET", "test-secret")
@@ -0,0 +1,55 @@
+"""
+Tests for CoverageAnalyzer's streaming XML (Cobertura) parser.
+"""
+
+from app.static_analysis.coverage import CoverageAnalyzer
+
+# app/a.py repeats its lines under <methods>, as coverage.py writes them; only
+# the class's own <lines> count. app/b.py has method-level lines only.
+COBERTURA_REPORT = """<?xml version="1.0" ?>
+<coverage version="7.4.0">
+  <packages>
+    <package name="app">
+      <classes>
+        <class name="a.py" filename="app/a.py">
+          <methods>
+            <method name="f" signature="()">
+              <lines>
+                <line number="2" hits="1"/>
+                <line number="3" hits="0"/>
+              </lines>
+            </method>
+          </methods>
+          <lines>
+            <line number="1" hits="1"/>
+            <line number="2" hits="1"/>
+            <line number="3" hits="0"/>
+            <line number="4" hits="0"/>
+          </lines>
+        </class>
+        <class name="b.py" filename="app/b.py">
+          <methods>
+            <method name="g" signature="()">
+              <lines>
+                <line number="1" hits="1"/>
+              </lines>
+            </method>
+          </methods>
+        </class>
+      </classes>
+    </package>
+  </packages>
+</coverage>
+"""
+
+
+def test_xml_coverage_counts_class_level_lines_only():
+    analyzer = CoverageAnalyzer()
+    summary = analyzer.parse_coverage_report(COBERTURA_REPORT, format="xml")
+    
+    assert list(analyzer.file_coverage) == ["app/a.py"]
+    coverage = analyzer.file_coverage["app/a.py"]
+    assert (coverage.lines_covered, coverage.lines_total) == (2, 4)
+    assert coverage.line_coverage == 50.0
+    assert coverage.uncovered_lines == frozenset({3, 4})
+    assert (summary.lines_covered, summary.lines_total) == (2, 4)
@@ -0,0 +1,33 @@
+"""
+Tests for the in-process flake8 checks in LintingAnalyzer.
+"""
+
+import pytest
+
+from app.static_analysis.linting import LintingAnalyzer
+
+
+async def run_flake8(content: str):
+    issues = await LintingAnalyzer()._run_flake8([("example.py", content)])
+    return [(issue.line, issue.code) for issue in issues]
+
+
+@pytest.mark.asyncio
+async def test_flake8_reports_unsuppressed_issues():
+    assert await run_flake8("import os\nx=1\n") == [(1, "F401"), (2, "E225")]
+
+
+@pytest.mark.asyncio
+async def test_flake8_honours_bare_noqa():
+    assert await run_flake8("import os  # noqa\nx=1  # noqa\n") == []
+
+
+@pytest.mark.asyncio
+async def test_flake8_honours_code_specific_noqa():
+    content = (
+        "import os  # noqa: F401\n"
+        "import sys  # noqa: E225\n"
+        "x=1  # NOQA:E2\n"
+        f"y = '{'y' * 130}'  # noqa: F401\n"
+    )
+    assert await run_flake8(content) == [(2, "F401"), (4, "E501")]
@@ -0,0 +1,125 @@
+"""
+Tests for S3Client's review download cache.
+"""
+
+import gzip
+from io import BytesIO
+
+import orjson
+import pytest
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+from app.config import settings
+from app.storage import s3
+from app.storage.s3 import S3Client
+
+BUCKET = "test-bucket"
+KEY = "reviews/octo/repo/1/20240101_000000.json"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(s3, "_review_cache", {})
+    monkeypatch.setattr(s3, "_review_cache_bytes", 0)
+    return S3Client(settings.model_copy(update={
+        "S3_ENABLED": True,
+        "S3_BUCKET_NAME": BUCKET,
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+    }))
+
+
+@pytest.fixture
+def stubber(client):
+    with Stubber(client.client) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+def stub_get(stubber, review, etag, if_none_match=None):
+    body = gzip.compress(orjson.dumps(review))
+    expected = {"Bucket": BUCKET, "Key": KEY}
+    if if_none_match:
+        expected["IfNoneMatch"] = if_none_match
+    stubber.add_response(
+        "get_object",
+        {
+            "Body": StreamingBody(BytesIO(body), len(body)),
+            "ETag": etag,
+            "ContentEncoding": "gzip",
+        },
+        expected,
+    )
+
+
+def stub_not_modified(stubber, etag):
+    stubber.add_client_error(
+        "get_object",
+        service_error_code="304",
+        http_status_code=304,
+        expected_params={"Bucket": BUCKET, "Key": KEY, "IfNoneMatch": etag},
+    )
+
+
+@pytest.mark.asyncio
+async def test_download_review_revalidates_cached_body(client, stubber):
+    stub_get(stubber, {"score": 1}, '"v1"')
+    stub_not_modified(stubber, '"v1"')
+    
+    assert await client.download_review(KEY) == {"score": 1}
+    assert await client.download_review(KEY) == {"score": 1}
+
+
+@pytest.mark.asyncio
+async def test_download_review_replaces_changed_body(client, stubber):
+    stub_get(stubber, {"score": 1}, '"v1"')
+    stub_get(stubber, {"score": 2}, '"v2"', if_none_match='"v1"')
+    stub_not_modified(stubber, '"v2"')
+    
+    assert await client.download_review(KEY) == {"score": 1}
+    assert await client.download_review(KEY) == {"score": 2}
+    assert await client.download_review(KEY) == {"score": 2}
+
+
+@pytest.mark.asyncio
+async def test_download_review_refetches_entry_evicted_in_flight(
+    client, stubber, monkeypatch
+):
+    fetch_review = S3Client._fetch_review
+    
+    def fetch_then_evict(self, key, etag):
+        result = fetch_review(self, key, etag)
+        if etag:
+            # A delete lands while the conditional GET is in flight
+            s3._evict_review(self.bucket_name, key)
+        return result
+    
+    monkeypatch.setattr(S3Client, "_fetch_review", fetch_then_evict)
+    stub_get(stubber, {"score": 1}, '"v1"')
+    stub_not_modified(stubber, '"v1"')
+    stub_get(stubber, {"score": 2}, '"v2"')
+    
+    assert await client.download_review(KEY) == {"score": 1}
+    assert await client.download_review(KEY) == {"score": 2}
+
+
+@pytest.mark.asyncio
+async def test_delete_review_evicts_cached_body(client, stubber):
+    stub_get(stubber, {"score": 1}, '"v1"')
+    stubber.add_response(
+        "delete_objects",
+        {},
+        {"Bucket": BUCKET, "Delete": {"Objects": [{"Key": KEY}], "Quiet": True}},
+    )
+    stubber.add_client_error(
+        "get_object",
+        service_error_code="NoSuchKey",
+        http_status_code=404,
+        expected_params={"Bucket": BUCKET, "Key": KEY},
+    )
+    
+    assert await client.download_review(KEY) == {"score": 1}
+    assert await client.delete_review(KEY)
+    assert (BUCKET, KEY) not in s3._review_cache
+    assert await client.download_review(KEY) is None
@@ -0,0 +1,29 @@
+"""
+Tests for SecurityAnalyzer's Bandit integration.
+"""
+
+import pytest
+
+from app.config import settings
+from app.static_analysis.security import SecurityAnalyzer
+
+
+async def scan(monkeypatch, content: str):
+    monkeypatch.setattr(settings, "ENABLE_SECURITY_SCAN", True)
+    monkeypatch.setattr(settings, "BANDIT_SEVERITY_LEVEL", "low")
+    issues = await SecurityAnalyzer().analyze(
+        [{"filename": "example.py", "language": "python"}],
+        {"example.py": content},
+    )
+    return {issue.test_id for issue in issues}
+
+
+@pytest.mark.asyncio
+async def test_bandit_flags_from_imported_bare_name_calls(monkeypatch):
+    assert "B605" in await scan(monkeypatch, "from os import system\nsystem(cmd)\n")
+
+
+@pytest.mark.asyncio
+async def test_bandit_flags_startfile(monkeypatch):
+    assert "B606" in await scan(monkeypatch, "import os\nos.startfile(path)\n")
+    assert "B606" in await scan(monkeypatch, "from os import startfile\nstartfile(path)\n")